@@ -17,10 +17,22 @@ from typing import Optional, Dict, List, Any
 import logging
 import time
 
+try:
+    import orjson  # Optional: faster JSON decoding of API responses
+except ImportError:
+    orjson = None
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _json(response: requests.Response) -> Any:
+    """Decode a JSON response body, with orjson when it is installed."""
+    if orjson is None:
+        return response.json()
+    return orjson.loads(response.content)
+
+
 class CanPLAPIClient:
     """Client for the CanPL Sports Data Platform API."""
 
@@ -77,8 +89,9 @@ class CanPLAPIClient:
             time.sleep(self._rate_limit_delay)  # Rate limiting
             response = self.session.get(url, params=params, timeout=30)
             response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
+            return _json(response)
+        except (requests.RequestException, ValueError) as e:
+            # ValueError: body isn't JSON (orjson's and the stdlib's decode errors)
             logger.error(f"API request failed: {e}")
             raise
 
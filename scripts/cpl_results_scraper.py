@@ -16,15 +16,32 @@ Run:
 """
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
+import asyncio
 import time
 import logging
 import json
 import os
 import re
-from typing import Optional, List, Dict
+from functools import lru_cache
+from io import StringIO
+from typing import Optional, List, Dict, Tuple
+
+try:
+    import httpx  # Optional: HTTP/2 prefetch of FBref/Wikipedia pages
+except ImportError:
+    httpx = None
+
+try:
+    import lxml  # noqa: F401  Optional: C-backed HTML parser for BeautifulSoup
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
 
 # Configure logging
 logging.basicConfig(
@@ -33,6 +50,16 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Imported after logging is configured: canpl_api_client calls basicConfig
+# itself, which would otherwise win and drop this script's format
+try:
+    from canpl_api_client import CanPLAPIClient  # Sibling script; official SDP API
+except ImportError:
+    try:
+        from scripts.canpl_api_client import CanPLAPIClient
+    except ImportError:
+        CanPLAPIClient = None
+
 # CPL Teams mapping
 CPL_TEAMS = {
     'forge': 'Forge FC',
@@ -59,6 +86,38 @@ CPL_TEAMS = {
     'ottawa': 'Atletico Ottawa',
 }
 
+# Columns identifying a single fixture, used for deduplication
+MATCH_KEY = ['season', 'date', 'home_team', 'away_team']
+
+# Score cell such as "2-1", "2 – 1" or "2:1"
+SCORE_RE = re.compile(r'(\d+)\s*[-–:]\s*(\d+)')
+
+# Source-specific score formats: Transfermarkt ("2:1") and Soccerway ("2 - 1")
+TRANSFERMARKT_SCORE_RE = re.compile(r'(\d+):(\d+)')
+SOCCERWAY_SCORE_RE = re.compile(r'(\d+)\s*-\s*(\d+)')
+
+# Shared categorical dtype for team columns so every season uses the same codes
+TEAM_DTYPE = pd.CategoricalDtype(sorted(set(CPL_TEAMS.values())))
+
+# Every alias, lowercased canonical name and short name -> canonical name
+TEAM_LOOKUP = dict(CPL_TEAMS)
+for _team in CPL_TEAMS.values():
+    TEAM_LOOKUP.setdefault(_team.lower(), _team)
+    TEAM_LOOKUP.setdefault(_team.replace(' FC', '').replace('FC ', '').lower(), _team)
+
+# Transfermarkt and Soccerway results are table rows, so only <tr> subtrees are
+# built; the rest of the page (nav, ads, scripts) is skipped while parsing.
+# Filtered by tag only: class matching during the parse misses rows carrying
+# more than one class (e.g. "odd highlight")
+TABLE_ROWS = SoupStrainer('tr')
+
+# Single alternation over every club's short name (e.g. "Forge", "HFX Wanderers"),
+# used to discard tables that never mention a CPL team before they are parsed
+TEAM_ALT_RE = re.compile('|'.join(
+    re.escape(team.replace(' FC', '').replace('FC ', ''))
+    for team in sorted(set(CPL_TEAMS.values()))
+))
+
 
 class CPLScraper:
     """Scraper for Canadian Premier League match data."""
@@ -80,6 +139,29 @@ class CPLScraper:
         'Vancouver FC': 'Willoughby Community Park',
     }
 
+    # Date formats tried by _parse_date, most common first
+    DATE_FORMATS = (
+        '%Y-%m-%d',
+        '%B %d, %Y',
+        '%b %d, %Y',
+        '%d/%m/%Y',
+        '%m/%d/%Y',
+    )
+
+    # All-numeric DATE_FORMATS, split by regex and checked by datetime() instead
+    # of strptime; (year, month, day) group numbers per format, in the same
+    # order, so day-first still wins for ambiguous slash dates
+    NUMERIC_DATES = (
+        (re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2})'), ((1, 2, 3),)),
+        (re.compile(r'(\d{1,2})/(\d{1,2})/(\d{4})'), ((3, 2, 1), (3, 1, 2))),
+    )
+
+    # Shape of the month-name DATE_FORMATS, so _parse_date only tries them
+    # when they can match
+    DATE_DISPATCH = (
+        (re.compile(r'[A-Za-z]+ \d{1,2}, \d{4}$'), ('%B %d, %Y', '%b %d, %Y')),
+    )
+
     def __init__(self, data_dir: str = "data/matches"):
         self.data_dir = data_dir
         self.session = requests.Session()
@@ -98,14 +180,111 @@ class CPLScraper:
             'Sec-Fetch-User': '?1',
             'Cache-Control': 'max-age=0',
         })
+        # Retry transient failures with backoff; keep the final response so
+        # callers still see the status through raise_for_status()
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 502, 503, 504],
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        # Page bodies fetched ahead of time by _prefetch_pages, keyed by URL
+        self._prefetched: Dict[str, str] = {}
+        # Page bodies already fetched today, keyed by (url, ISO date)
+        self._html_cache: Dict[Tuple[str, str], str] = {}
         os.makedirs(data_dir, exist_ok=True)
 
+    def _fetch_html(self, url: str) -> str:
+        """Return page HTML, reusing today's cached or prefetched body when available."""
+        key = (url, datetime.now().date().isoformat())
+        if key in self._html_cache:
+            return self._html_cache[key]
+
+        if url in self._prefetched:
+            html = self._prefetched.pop(url)
+        else:
+            response = self.session.get(url, timeout=30)
+            response.raise_for_status()
+            html = response.text
+
+        self._html_cache[key] = html
+        return html
+
+    async def _afetch(self, urls: List[str]) -> Dict[str, str]:
+        """Fetch URLs concurrently over multiplexed HTTP/2 connections."""
+        # Let httpx negotiate its own encodings (brotli support is optional)
+        headers = {k: v for k, v in self.session.headers.items() if k != 'Accept-Encoding'}
+        async with httpx.AsyncClient(
+            http2=True,
+            headers=headers,
+            timeout=30,
+            limits=httpx.Limits(max_keepalive_connections=16),
+        ) as client:
+            responses = await asyncio.gather(*(client.get(url) for url in urls), return_exceptions=True)
+
+        return {
+            url: r.text for url, r in zip(urls, responses)
+            if isinstance(r, httpx.Response) and r.status_code == 200
+        }
+
+    async def _aprefetch(self, years: List[int]) -> Dict[str, str]:
+        """Fetch FBref season pages, then Wikipedia only for seasons FBref didn't return."""
+        pages = await self._afetch([self._fbref_url(y) for y in years])
+
+        # Wikipedia is the fallback source, so it is only worth fetching where
+        # the FBref page is already known to be missing
+        fallback = [self._wikipedia_url(y) for y in years if self._fbref_url(y) not in pages]
+        if fallback:
+            pages.update(await self._afetch(fallback))
+        return pages
+
+    def _prefetch_pages(self, years: List[int]):
+        """Prefetch FBref season pages (and Wikipedia where those fail); falls back to requests if unavailable."""
+        if httpx is None:
+            return
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            # asyncio.run can't nest; pages are fetched on demand instead
+            logger.debug("HTTP/2 prefetch skipped: already inside an event loop")
+            return
+
+        try:
+            self._prefetched = asyncio.run(self._aprefetch(years))
+            logger.info(f"Prefetched {len(self._prefetched)} pages over HTTP/2")
+        except ImportError as e:
+            # h2 not installed
+            logger.debug(f"HTTP/2 prefetch unavailable: {e}")
+
+    def _make_soup(self, html: str, strainer: Optional[SoupStrainer] = None) -> BeautifulSoup:
+        """Parse HTML with the fastest available parser, optionally only the strained subtree."""
+        return BeautifulSoup(html, HTML_PARSER, parse_only=strainer)
+
+    def _wikipedia_url(self, year: int) -> str:
+        return f"{self.WIKIPEDIA_URL}/wiki/{year}_Canadian_Premier_League_season"
+
+    def _fbref_url(self, year: int) -> str:
+        return f"https://fbref.com/en/comps/211/{year}/schedule/{year}-Canadian-Premier-League-Scores-and-Fixtures"
+
     def normalize_team_name(self, team: str) -> str:
         """Normalize team name to standard format."""
         team_lower = team.lower().strip()
-        return CPL_TEAMS.get(team_lower, team.strip())
+        return TEAM_LOOKUP.get(team_lower, team.strip())
 
     def scrape_from_wikipedia(self, year: int) -> pd.DataFrame:
+        """Scrape CPL match results from Wikipedia as a DataFrame."""
+        df = pd.DataFrame(self._scrape_wikipedia_rows(year))
+        if df.empty:
+            return df
+        return df.drop_duplicates(subset=MATCH_KEY, ignore_index=True)
+
+    def _scrape_wikipedia_rows(self, year: int) -> List[Dict]:
         """
         Scrape CPL match results from Wikipedia using pandas read_html.
 
@@ -113,148 +292,122 @@ class CPLScraper:
             year: Season year (2019-2025)
 
         Returns:
-            DataFrame with match data
+            List of match dicts
         """
         logger.info(f"Scraping CPL {year} season from Wikipedia...")
 
         matches = []
-        url = f"{self.WIKIPEDIA_URL}/wiki/{year}_Canadian_Premier_League_season"
+        url = self._wikipedia_url(year)
 
         try:
             # Fetch page with proper headers first
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
+            html = self._fetch_html(url)
 
-            # Use pandas read_html on the fetched HTML content
-            from io import StringIO
-            tables = pd.read_html(StringIO(response.text))
-
-            # Known CPL teams for validation
-            cpl_teams = set(CPL_TEAMS.values())
+            # Use pandas read_html on the fetched HTML content; `match` drops
+            # tables with no CPL team name before they are turned into DataFrames
+            try:
+                tables = pd.read_html(StringIO(html), match=TEAM_ALT_RE)
+            except ValueError:
+                # read_html raises when no table matches
+                tables = []
 
             for df in tables:
                 # Skip small tables
                 if len(df) < 5:
                     continue
 
-                # Look for tables that have team names in them
-                df_str = df.astype(str)
-
-                # Check if this looks like a results table
-                for col in df.columns:
-                    col_values = df_str[col].tolist()
-
-                    for team_name in cpl_teams:
-                        # Check for partial team name matches
-                        short_name = team_name.replace(' FC', '').replace('FC ', '')
-                        if any(short_name in str(val) for val in col_values):
-                            # This might be a results table, try to parse it
-                            parsed = self._parse_results_table(df, year)
-                            matches.extend(parsed)
-                            break
-
-            # Deduplicate matches
-            seen = set()
-            unique_matches = []
-            for m in matches:
-                key = (m.get('date', ''), m.get('home_team', ''), m.get('away_team', ''))
-                if key not in seen and m.get('home_team') and m.get('away_team'):
-                    seen.add(key)
-                    unique_matches.append(m)
-
-            logger.info(f"Found {len(unique_matches)} matches for {year} from Wikipedia")
-            return pd.DataFrame(unique_matches)
+                matches.extend(self._parse_results_table(df, year))
+
+            # Tables overlap (results matrix + round-by-round); callers dedupe on MATCH_KEY
+            logger.info(f"Found {len(matches)} match rows for {year} from Wikipedia")
+            return matches
 
         except Exception as e:
             logger.error(f"Error fetching Wikipedia data: {e}")
             logger.debug(f"Exception details: {str(e)}")
-            return pd.DataFrame()
+            return []
 
     def _parse_results_table(self, df: pd.DataFrame, year: int) -> List[Dict]:
         """Parse a DataFrame that might contain match results."""
         matches = []
-        score_pattern = re.compile(r'(\d+)\s*[-–:]\s*(\d+)')
-
-        df_str = df.astype(str)
-        cols = df.columns.tolist()
-
-        for idx, row in df_str.iterrows():
-            row_vals = row.tolist()
-
-            # Look for a score pattern in this row
-            for i, val in enumerate(row_vals):
-                score_match = score_pattern.search(val)
-                if score_match:
-                    home_goals = int(score_match.group(1))
-                    away_goals = int(score_match.group(2))
-
-                    # Try to find team names before and after the score
-                    home_team = None
-                    away_team = None
-                    date = None
-
-                    # Look for team names in adjacent columns
-                    for j, v in enumerate(row_vals):
-                        if j == i:
-                            continue
-
-                        # Check if this is a team name
-                        team = self._match_team_name(v)
-                        if team:
-                            if j < i and not home_team:
-                                home_team = team
-                            elif j > i and not away_team:
-                                away_team = team
-
-                        # Check if this looks like a date
-                        if not date:
-                            parsed_date = self._parse_date(v)
-                            if parsed_date:
-                                date = parsed_date
-
-                    if home_team and away_team:
-                        # Set default date if not found
-                        if not date:
-                            date = f"{year}-01-01"  # Placeholder
-
-                        matches.append({
-                            'season': year,
-                            'date': date,
-                            'home_team': home_team,
-                            'away_team': away_team,
-                            'home_goals': home_goals,
-                            'away_goals': away_goals,
-                            'venue': self.STADIUMS.get(home_team, 'Unknown'),
-                        })
-                    break
+
+        # Stringify one row at a time instead of copying the whole frame
+        for row in df.to_numpy(dtype=object):
+            row_vals = [str(v) for v in row]
+
+            # Locate the first cell carrying a score; skip rows without one
+            hit = next(
+                ((i, m) for i, val in enumerate(row_vals) if (m := SCORE_RE.search(val))),
+                None,
+            )
+            if hit is None:
+                continue
+            i, score_match = hit
+            home_goals = int(score_match.group(1))
+            away_goals = int(score_match.group(2))
+
+            # Try to find team names before and after the score
+            home_team = None
+            away_team = None
+            date = None
+
+            # Look for team names in adjacent columns
+            for j, v in enumerate(row_vals):
+                if j == i:
+                    continue
+
+                # Check if this is a team name
+                team = self._match_team_name(v)
+                if team:
+                    if j < i and not home_team:
+                        home_team = team
+                    elif j > i and not away_team:
+                        away_team = team
+
+                # Check if this looks like a date
+                if not date:
+                    parsed_date = self._parse_date(v)
+                    if parsed_date:
+                        date = parsed_date
+
+            if home_team and away_team:
+                # Set default date if not found
+                if not date:
+                    date = f"{year}-01-01"  # Placeholder
+
+                matches.append({
+                    'season': year,
+                    'date': date,
+                    'home_team': home_team,
+                    'away_team': away_team,
+                    'home_goals': home_goals,
+                    'away_goals': away_goals,
+                    'venue': self.STADIUMS.get(home_team, 'Unknown'),
+                })
 
         return matches
 
     def _match_team_name(self, text: str) -> Optional[str]:
         """Try to match text to a known CPL team."""
-        text = str(text).strip()
+        text_lower = str(text).strip().lower()
 
-        # Direct match
-        if text in CPL_TEAMS:
-            return CPL_TEAMS[text]
-        if text in CPL_TEAMS.values():
-            return text
+        # Direct match (aliases, canonical and short names)
+        team = TEAM_LOOKUP.get(text_lower)
+        if team:
+            return team
 
         # Partial match
-        text_lower = text.lower()
-        for key, team in CPL_TEAMS.items():
+        for key, team in TEAM_LOOKUP.items():
             if key in text_lower or text_lower in key:
                 return team
 
-        # Check for short names
-        for team in CPL_TEAMS.values():
-            short = team.replace(' FC', '').replace('FC ', '').lower()
-            if short in text_lower or text_lower in short:
-                return team
-
         return None
 
     def scrape_from_transfermarkt(self, year: int) -> pd.DataFrame:
+        """Scrape CPL match results from Transfermarkt as a DataFrame."""
+        return pd.DataFrame(self._scrape_transfermarkt_rows(year))
+
+    def _scrape_transfermarkt_rows(self, year: int) -> List[Dict]:
         """
         Scrape CPL match results from Transfermarkt.
 
@@ -262,7 +415,7 @@ class CPLScraper:
             year: Season year
 
         Returns:
-            DataFrame with match data
+            List of match dicts
         """
         logger.info(f"Scraping CPL {year} season from Transfermarkt...")
 
@@ -271,9 +424,7 @@ class CPLScraper:
         url = f"https://www.transfermarkt.com/canadian-premier-league/gesamtspielplan/wettbewerb/CAPL/saison_id/{year}"
 
         try:
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = self._make_soup(self._fetch_html(url), TABLE_ROWS)
 
             # Find match rows
             match_rows = soup.find_all('tr', class_=['odd', 'even'])
@@ -294,7 +445,7 @@ class CPLScraper:
                         away_team = self.normalize_team_name(team_cells[1].get_text(strip=True))
 
                         score_text = score_cell.get_text(strip=True)
-                        score_match = re.match(r'(\d+):(\d+)', score_text)
+                        score_match = TRANSFERMARKT_SCORE_RE.match(score_text)
 
                         if score_match:
                             matches.append({
@@ -307,17 +458,21 @@ class CPLScraper:
                                 'venue': self.STADIUMS.get(home_team, 'Unknown'),
                             })
                 except Exception as e:
-                    logger.debug(f"Error parsing Transfermarkt row: {e}")
+                    logger.debug("Error parsing Transfermarkt row: %s", e)
                     continue
 
             logger.info(f"Found {len(matches)} matches for {year} from Transfermarkt")
-            return pd.DataFrame(matches)
+            return matches
 
         except requests.RequestException as e:
             logger.error(f"Error fetching Transfermarkt data: {e}")
-            return pd.DataFrame()
+            return []
 
     def scrape_from_fbref(self, year: int) -> pd.DataFrame:
+        """Scrape CPL match results from FBref as a DataFrame."""
+        return pd.DataFrame(self._scrape_fbref_rows(year))
+
+    def _scrape_fbref_rows(self, year: int) -> List[Dict]:
         """
         Scrape CPL match results from FBref (Sports Reference).
         FBref has clean, well-structured tables with match data including xG.
@@ -328,20 +483,18 @@ class CPLScraper:
             year: Season year
 
         Returns:
-            DataFrame with match data
+            List of match dicts
         """
         logger.info(f"Scraping CPL {year} season from FBref...")
 
         # FBref CPL scores and fixtures page - competition ID 211
-        url = f"https://fbref.com/en/comps/211/{year}/schedule/{year}-Canadian-Premier-League-Scores-and-Fixtures"
+        url = self._fbref_url(year)
 
         try:
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
+            html = self._fetch_html(url)
 
             # FBref uses clean HTML tables - perfect for pandas
-            from io import StringIO
-            tables = pd.read_html(StringIO(response.text))
+            tables = pd.read_html(StringIO(html))
 
             # The schedule table is usually the first one with match data
             matches_df = None
@@ -354,7 +507,7 @@ class CPLScraper:
 
             if matches_df is None or matches_df.empty:
                 logger.warning(f"No match table found for {year}")
-                return pd.DataFrame()
+                return []
 
             # Standardize column names (FBref uses various formats)
             col_mapping = {}
@@ -383,28 +536,26 @@ class CPLScraper:
 
             matches_df = matches_df.rename(columns=col_mapping)
 
-            # Process each row
-            processed_matches = []
-            for _, row in matches_df.iterrows():
-                try:
-                    match = self._process_fbref_match(row, year)
-                    if match:
-                        processed_matches.append(match)
-                except Exception as e:
-                    logger.debug(f"Error processing row: {e}")
-                    continue
+            # Process each row as a plain dict (_process_fbref_match handles its own errors)
+            processed_matches = [
+                match for match in (
+                    self._process_fbref_match(row, year)
+                    for row in matches_df.to_dict('records')
+                )
+                if match
+            ]
 
             logger.info(f"Found {len(processed_matches)} matches for {year} from FBref")
-            return pd.DataFrame(processed_matches)
+            return processed_matches
 
         except requests.RequestException as e:
             logger.error(f"Error fetching FBref data: {e}")
-            return pd.DataFrame()
+            return []
         except Exception as e:
             logger.error(f"Error parsing FBref data: {e}")
-            return pd.DataFrame()
+            return []
 
-    def _process_fbref_match(self, row, year: int) -> Optional[Dict]:
+    def _process_fbref_match(self, row: Dict, year: int) -> Optional[Dict]:
         """Process a single match row from FBref."""
         try:
             # Get score and split into home/away goals
@@ -460,10 +611,14 @@ class CPLScraper:
             return match
 
         except Exception as e:
-            logger.debug(f"FBref parse error: {e}")
+            logger.debug("FBref parse error: %s", e)
             return None
 
     def scrape_from_soccerway(self, year: int) -> pd.DataFrame:
+        """Scrape CPL match results from Soccerway as a DataFrame."""
+        return pd.DataFrame(self._scrape_soccerway_rows(year))
+
+    def _scrape_soccerway_rows(self, year: int) -> List[Dict]:
         """
         Scrape CPL match results from Soccerway.
 
@@ -471,7 +626,7 @@ class CPLScraper:
             year: Season year
 
         Returns:
-            DataFrame with match data
+            List of match dicts
         """
         logger.info(f"Scraping CPL {year} season from Soccerway...")
 
@@ -480,9 +635,7 @@ class CPLScraper:
         url = f"https://int.soccerway.com/national/canada/canadian-premier-league/{year}/regular-season/r{year - 1900 + 58000}/matches/"
 
         try:
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = self._make_soup(self._fetch_html(url), TABLE_ROWS)
 
             # Find match rows
             match_rows = soup.find_all('tr', class_=['match'])
@@ -497,7 +650,7 @@ class CPLScraper:
 
                     if all([date_cell, home_cell, score_cell, away_cell]):
                         score_text = score_cell.get_text(strip=True)
-                        score_match = re.match(r'(\d+)\s*-\s*(\d+)', score_text)
+                        score_match = SOCCERWAY_SCORE_RE.match(score_text)
 
                         if score_match:
                             home_team = self.normalize_team_name(home_cell.get_text(strip=True))
@@ -513,22 +666,24 @@ class CPLScraper:
                                 'venue': self.STADIUMS.get(home_team, 'Unknown'),
                             })
                 except Exception as e:
-                    logger.debug(f"Error parsing Soccerway row: {e}")
+                    logger.debug("Error parsing Soccerway row: %s", e)
                     continue
 
             logger.info(f"Found {len(matches)} matches for {year} from Soccerway")
-            return pd.DataFrame(matches)
+            return matches
 
         except requests.RequestException as e:
             logger.error(f"Error fetching Soccerway data: {e}")
-            return pd.DataFrame()
+            return []
 
-    def scrape_canpl_season(self, year: int) -> pd.DataFrame:
+    def scrape_canpl_season(self, year: int, use_cache: bool = False) -> pd.DataFrame:
         """
         Scrape all CPL matches for a season from canpl.ca.
 
         Args:
             year: Season year (2019-2026)
+            use_cache: Send a conditional GET using the ETag/Last-Modified of the
+                previous scrape and reuse the cached copy if the page is unchanged
 
         Returns:
             DataFrame with match data
@@ -536,14 +691,29 @@ class CPLScraper:
         logger.info(f"Scraping CPL {year} season from canpl.ca...")
 
         matches = []
+        cache_csv = os.path.join(self.data_dir, f".canpl_schedule_{year}.csv")
+        cache_meta = f"{cache_csv}.json"
 
         try:
             # CPL website structure - adjust URL as needed
             url = f"{self.BASE_URL}/schedule?season={year}"
-            response = self.session.get(url, timeout=30)
+
+            headers = {}
+            if use_cache and os.path.exists(cache_csv) and os.path.exists(cache_meta):
+                with open(cache_meta) as f:
+                    validators = json.load(f)
+                if validators.get('etag'):
+                    headers['If-None-Match'] = validators['etag']
+                if validators.get('last_modified'):
+                    headers['If-Modified-Since'] = validators['last_modified']
+
+            response = self.session.get(url, headers=headers, timeout=30)
+            if response.status_code == 304:
+                logger.info(f"canpl.ca schedule for {year} not modified, using cached copy")
+                return self.load_from_csv(cache_csv)
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = self._make_soup(response.text)
 
             # Find match elements - selectors may need adjustment
             match_elements = soup.find_all('div', class_=['match', 'match-card', 'fixture'])
@@ -559,6 +729,14 @@ class CPLScraper:
 
             logger.info(f"Found {len(matches)} matches for {year}")
 
+            if use_cache and matches:
+                pd.DataFrame(matches).to_csv(cache_csv, index=False, lineterminator='\n')
+                with open(cache_meta, 'w') as f:
+                    json.dump({
+                        'etag': response.headers.get('ETag'),
+                        'last_modified': response.headers.get('Last-Modified'),
+                    }, f)
+
         except requests.RequestException as e:
             logger.error(f"Error fetching data: {e}")
 
@@ -596,18 +774,27 @@ class CPLScraper:
             return match
 
         except Exception as e:
-            logger.debug(f"Parse error: {e}")
+            logger.debug("Parse error: %s", e)
             return None
 
     def _parse_date(self, date_str: str) -> str:
         """Parse date string to standard format."""
-        formats = [
-            '%Y-%m-%d',
-            '%B %d, %Y',
-            '%b %d, %Y',
-            '%d/%m/%Y',
-            '%m/%d/%Y',
-        ]
+        for pattern, field_orders in self.NUMERIC_DATES:
+            m = pattern.fullmatch(date_str)
+            if m:
+                for year, month, day in field_orders:
+                    try:
+                        return datetime(int(m[year]), int(m[month]), int(m[day])).strftime('%Y-%m-%d')
+                    except ValueError:
+                        continue
+                return date_str
+
+        for pattern, formats in self.DATE_DISPATCH:
+            if pattern.match(date_str):
+                break
+        else:
+            # Unusual spacing or padding that strptime still accepts
+            formats = self.DATE_FORMATS
 
         for fmt in formats:
             try:
@@ -619,6 +806,10 @@ class CPLScraper:
         return date_str
 
     def scrape_from_api(self, year: int) -> pd.DataFrame:
+        """Scrape CPL match results from API as a DataFrame."""
+        return pd.DataFrame(self._scrape_api_rows(year))
+
+    def _scrape_api_rows(self, year: int) -> List[Dict]:
         """
         Alternative: Scrape from API endpoints if available.
         Many sports sites have hidden JSON APIs.
@@ -646,7 +837,7 @@ class CPLScraper:
             except Exception:
                 continue
 
-        return pd.DataFrame(matches)
+        return matches
 
     def _parse_api_response(self, data: dict, year: int) -> List[Dict]:
         """Parse JSON API response."""
@@ -673,7 +864,7 @@ class CPLScraper:
                 }
                 matches.append(match)
             except Exception as e:
-                logger.debug(f"API parse error: {e}")
+                logger.debug("API parse error: %s", e)
                 continue
 
         return matches
@@ -688,7 +879,7 @@ class CPLScraper:
     def save_to_csv(self, df: pd.DataFrame, year: int) -> str:
         """Save DataFrame to CSV."""
         filepath = os.path.join(self.data_dir, f"cpl_{year}.csv")
-        df.to_csv(filepath, index=False)
+        df.to_csv(filepath, index=False, lineterminator='\n')
         logger.info(f"Saved {len(df)} matches to {filepath}")
         return filepath
 
@@ -702,6 +893,9 @@ class CPLScraper:
         3. Transfermarkt (backup)
         4. CPL API (if available)
         """
+        # Warm FBref/Wikipedia pages for every season in one concurrent batch
+        self._prefetch_pages(list(range(start_year, end_year + 1)))
+
         all_matches = []
 
         for year in range(start_year, end_year + 1):
@@ -709,47 +903,53 @@ class CPLScraper:
             logger.info(f"Processing {year} season")
             logger.info('='*50)
 
-            df = pd.DataFrame()
+            rows = []
 
             # Try FBref first (cleanest data)
             try:
-                df = self.scrape_from_fbref(year)
+                rows = self._scrape_fbref_rows(year)
             except Exception as e:
                 logger.debug(f"FBref scrape error: {e}")
 
             # Fall back to Wikipedia
-            if df.empty:
+            if not rows:
                 logger.info(f"FBref scrape failed for {year}, trying Wikipedia...")
                 try:
-                    df = self.scrape_from_wikipedia(year)
+                    rows = self._scrape_wikipedia_rows(year)
                 except Exception as e:
                     logger.debug(f"Wikipedia scrape error: {e}")
 
             # Fall back to Soccerway
-            if df.empty:
+            if not rows:
                 logger.info(f"Wikipedia scrape failed for {year}, trying Soccerway...")
                 try:
-                    df = self.scrape_from_soccerway(year)
+                    rows = self._scrape_soccerway_rows(year)
                 except Exception as e:
                     logger.debug(f"Soccerway scrape error: {e}")
 
             # Fall back to Transfermarkt
-            if df.empty:
+            if not rows:
                 logger.info(f"Soccerway scrape failed for {year}, trying Transfermarkt...")
                 try:
-                    df = self.scrape_from_transfermarkt(year)
+                    rows = self._scrape_transfermarkt_rows(year)
                 except Exception as e:
                     logger.debug(f"Transfermarkt scrape error: {e}")
 
             # Fall back to API if available
-            if df.empty:
+            if not rows:
                 logger.info(f"Transfermarkt scrape failed for {year}, trying API...")
                 try:
-                    df = self.scrape_from_api(year)
+                    rows = self._scrape_api_rows(year)
                 except Exception as e:
                     logger.debug(f"API scrape error: {e}")
 
-            if not df.empty:
+            if rows:
+                # Sources return plain row dicts; one frame per season keeps each
+                # season's dtypes its own, and it is saved before the next is fetched.
+                # One hash-based pass removes repeated fixtures
+                df = pd.DataFrame.from_records(rows).drop_duplicates(
+                    subset=MATCH_KEY, ignore_index=True
+                )
                 self.save_to_csv(df, year)
                 all_matches.append(df)
             else:
@@ -758,11 +958,16 @@ class CPLScraper:
             # Be respectful to servers
             time.sleep(2)
 
+        # Drop fallback pages that were never needed
+        self._prefetched = {}
+
         if all_matches:
+            # Seasons never share a MATCH_KEY, so they are already distinct
             combined = pd.concat(all_matches, ignore_index=True)
+
             # Save combined file
             all_filepath = os.path.join(self.data_dir, "cpl_all.csv")
-            combined.to_csv(all_filepath, index=False)
+            combined.to_csv(all_filepath, index=False, lineterminator='\n')
             logger.info(f"Saved combined dataset: {len(combined)} total matches to {all_filepath}")
             return combined
 
@@ -771,7 +976,7 @@ class CPLScraper:
     def get_recent_matches(self, days: int = 7) -> pd.DataFrame:
         """Get matches from the last N days."""
         current_year = datetime.now().year
-        df = self.scrape_canpl_season(current_year)
+        df = self.scrape_canpl_season(current_year, use_cache=True)
 
         if df.empty:
             return df
@@ -781,6 +986,182 @@ class CPLScraper:
         return df[df['date'] >= cutoff]
 
 
+# Venue categories laid out in TEAM_DTYPE code order, so a home team's code is
+# also its stadium's code
+VENUE_DTYPE = pd.CategoricalDtype([CPLScraper.STADIUMS[team] for team in TEAM_DTYPE.categories])
+
+
+@lru_cache(maxsize=None)
+def get_all_seasons() -> pd.DataFrame:
+    """
+    All historical seasons in chronological order, parsed once and cached.
+
+    The returned DataFrame is shared between callers; copy it before mutating.
+    """
+    # Fixture data lives in its own module, loaded only when first needed
+    try:
+        from cpl_results_data import FIXTURES_CSV
+    except ImportError:
+        from scripts.cpl_results_data import FIXTURES_CSV
+
+    # One pass of the C CSV parser yields typed columns directly; every string
+    # column below ends up categorical, so no object-dtype column is kept
+    raw = pd.read_csv(
+        StringIO(FIXTURES_CSV),
+        comment='#',
+        dtype={'season': np.int16, 'home_goals': np.int8, 'away_goals': np.int8},
+    )
+
+    # One vectorized probe per column validates names and yields categorical codes
+    home_codes = TEAM_DTYPE.categories.get_indexer(raw['home_team'])
+    away_codes = TEAM_DTYPE.categories.get_indexer(raw['away_team'])
+    if (home_codes < 0).any() or (away_codes < 0).any():
+        unknown = set(raw['home_team'][home_codes < 0]) | set(raw['away_team'][away_codes < 0])
+        raise ValueError(f"Unknown team(s) in historical fixtures: {sorted(unknown)}")
+
+    return pd.DataFrame({
+        'date': pd.to_datetime(raw['date'], format='%Y-%m-%d', cache=True),
+        'home_team': pd.Categorical.from_codes(home_codes, dtype=TEAM_DTYPE),
+        'away_team': pd.Categorical.from_codes(away_codes, dtype=TEAM_DTYPE),
+        'home_goals': raw['home_goals'],
+        'away_goals': raw['away_goals'],
+        'season': raw['season'],
+        'venue': pd.Categorical.from_codes(home_codes, dtype=VENUE_DTYPE),
+    })
+
+
+@lru_cache(maxsize=None)
+def _historical_seasons() -> frozenset:
+    return frozenset(get_all_seasons()['season'].tolist())
+
+
+@lru_cache(maxsize=None)
+def get_season(year: int) -> pd.DataFrame:
+    """
+    Historical results for one season, sliced on first use and cached.
+
+    The returned DataFrame is shared between callers; copy it before mutating.
+    """
+    all_seasons = get_all_seasons()
+    return all_seasons[all_seasons['season'] == year].reset_index(drop=True)
+
+
+@lru_cache(maxsize=None)
+def _season_index(year: int) -> pd.DataFrame:
+    """Season results indexed and sorted on (date, home_team) for point lookups."""
+    return get_season(year).set_index(['date', 'home_team']).sort_index()
+
+
+def lookup_result(date: str, home_team: str) -> Optional[pd.Series]:
+    """
+    Find a historical result by match date and home team.
+
+    Args:
+        date: Match date (YYYY-MM-DD)
+        home_team: Canonical home team name
+
+    Returns:
+        The match row, or None if no such match is recorded
+    """
+    ts = pd.Timestamp(date)
+    if ts.year not in _historical_seasons():
+        return None
+
+    try:
+        return _season_index(ts.year).loc[[(ts, home_team)]].iloc[0]
+    except KeyError:
+        return None
+
+
+def get_results(season: Optional[int] = None) -> pd.DataFrame:
+    """
+    Historical results for one season, or all seasons when season is None.
+
+    Exact-season requests go straight to the cached per-season frame instead
+    of masking the combined frame.
+    """
+    if season is None:
+        return get_all_seasons()
+    if season in _historical_seasons():
+        return get_season(season)
+    return get_all_seasons().iloc[0:0]
+
+
+@lru_cache(maxsize=None)
+def _team_rows() -> Dict[int, np.ndarray]:
+    """Inverted index: TEAM_DTYPE code -> positions of that team's matches."""
+    df = get_all_seasons()
+    home_codes = df['home_team'].cat.codes.to_numpy()
+    away_codes = df['away_team'].cat.codes.to_numpy()
+    return {
+        code: np.flatnonzero((home_codes == code) | (away_codes == code))
+        for code in range(len(TEAM_DTYPE.categories))
+    }
+
+
+def get_team_matches(team: str) -> pd.DataFrame:
+    """All historical matches (home or away) for a team."""
+    code = TEAM_DTYPE.categories.get_indexer([team])[0]
+    if code < 0:
+        return get_all_seasons().iloc[0:0]
+    return get_all_seasons().take(_team_rows()[code])
+
+
+def _pair_key(home_codes: np.ndarray, away_codes: np.ndarray) -> np.ndarray:
+    """Order-independent fixture key from two TEAM_DTYPE codes."""
+    n = len(TEAM_DTYPE.categories)
+    return (np.minimum(home_codes, away_codes).astype(np.uint16) * n
+            + np.maximum(home_codes, away_codes).astype(np.uint16))
+
+
+@lru_cache(maxsize=None)
+def _all_pair_keys() -> np.ndarray:
+    df = get_all_seasons()
+    return _pair_key(df['home_team'].cat.codes.to_numpy(), df['away_team'].cat.codes.to_numpy())
+
+
+def get_head_to_head(team1: str, team2: str) -> pd.DataFrame:
+    """Historical matches between two teams, regardless of venue."""
+    codes = TEAM_DTYPE.categories.get_indexer([team1, team2])
+    if (codes < 0).any():
+        return get_all_seasons().iloc[0:0]
+
+    key = _pair_key(codes[:1], codes[1:])[0]
+    return get_all_seasons()[_all_pair_keys() == key]
+
+
+@lru_cache(maxsize=None)
+def _match_points() -> Tuple[np.ndarray, np.ndarray]:
+    """Home and away league points (3/1/0) for every historical match, computed once."""
+    df = get_all_seasons()
+    diff = df['home_goals'].to_numpy(np.int16) - df['away_goals'].to_numpy(np.int16)
+    home_pts = np.where(diff > 0, 3, np.where(diff == 0, 1, 0)).astype(np.int16)
+    away_pts = np.where(diff < 0, 3, np.where(diff == 0, 1, 0)).astype(np.int16)
+    return home_pts, away_pts
+
+
+def get_points_table(season: Optional[int] = None) -> pd.Series:
+    """League points per team from the historical fixtures, highest first."""
+    df = get_all_seasons()
+    home_pts, away_pts = _match_points()
+    home_codes = df['home_team'].cat.codes.to_numpy()
+    away_codes = df['away_team'].cat.codes.to_numpy()
+
+    if season is not None:
+        in_season = (df['season'] == season).to_numpy()
+        home_pts, away_pts = home_pts[in_season], away_pts[in_season]
+        home_codes, away_codes = home_codes[in_season], away_codes[in_season]
+
+    # Sum points per categorical code; teams with no matches are dropped
+    n = len(TEAM_DTYPE.categories)
+    points = (np.bincount(home_codes, weights=home_pts, minlength=n)
+              + np.bincount(away_codes, weights=away_pts, minlength=n))
+    played = np.bincount(home_codes, minlength=n) + np.bincount(away_codes, minlength=n)
+
+    table = pd.Series(points.astype(np.int16), index=TEAM_DTYPE.categories, name='points')
+    return table[played > 0].sort_values(ascending=False)
+
+
 def generate_historical_data() -> Dict[int, pd.DataFrame]:
     """
     Generate comprehensive CPL historical match data.
@@ -789,406 +1170,31 @@ def generate_historical_data() -> Dict[int, pd.DataFrame]:
     Note: This is reference data. For production use, verify against
     official CPL records at canpl.ca.
     """
+    return {year: get_season(year) for year in sorted(_historical_seasons(), reverse=True)}
 
-    # Team stadiums for venue lookup
-    STADIUMS = {
-        'Forge FC': 'Tim Hortons Field',
-        'Cavalry FC': 'ATCO Field',
-        'Pacific FC': 'Starlight Stadium',
-        'York United FC': 'York Lions Stadium',
-        'Valour FC': 'IG Field',
-        'HFX Wanderers FC': 'Wanderers Grounds',
-        'FC Edmonton': 'Clarke Stadium',
-        'Atletico Ottawa': 'TD Place Stadium',
-        'Vancouver FC': 'Willoughby Community Park',
-    }
 
-    # 2024 Season - Complete regular season results
-    season_2024 = [
-        # Week 1
-        {'date': '2024-04-13', 'home_team': 'Forge FC', 'away_team': 'Atletico Ottawa', 'home_goals': 1, 'away_goals': 0},
-        {'date': '2024-04-13', 'home_team': 'Cavalry FC', 'away_team': 'Pacific FC', 'home_goals': 2, 'away_goals': 1},
-        {'date': '2024-04-14', 'home_team': 'Valour FC', 'away_team': 'Vancouver FC', 'home_goals': 2, 'away_goals': 0},
-        {'date': '2024-04-14', 'home_team': 'York United FC', 'away_team': 'HFX Wanderers FC', 'home_goals': 1, 'away_goals': 1},
-        # Week 2
-        {'date': '2024-04-20', 'home_team': 'Pacific FC', 'away_team': 'Forge FC', 'home_goals': 0, 'away_goals': 2},
-        {'date': '2024-04-20', 'home_team': 'HFX Wanderers FC', 'away_team': 'Cavalry FC', 'home_goals': 1, 'away_goals': 3},
-        {'date': '2024-04-21', 'home_team': 'Atletico Ottawa', 'away_team': 'Valour FC', 'home_goals': 2, 'away_goals': 1},
-        {'date': '2024-04-21', 'home_team': 'Vancouver FC', 'away_team': 'York United FC', 'home_goals': 0, 'away_goals': 1},
-        # Week 3
-        {'date': '2024-04-27', 'home_team': 'Forge FC', 'away_team': 'Vancouver FC', 'home_goals': 3, 'away_goals': 0},
-        {'date': '2024-04-27', 'home_team': 'Cavalry FC', 'away_team': 'Atletico Ottawa', 'home_goals': 1, 'away_goals': 1},
-        {'date': '2024-04-28', 'home_team': 'York United FC', 'away_team': 'Pacific FC', 'home_goals': 2, 'away_goals': 2},
-        {'date': '2024-04-28', 'home_team': 'Valour FC', 'away_team': 'HFX Wanderers FC', 'home_goals': 1, 'away_goals': 0},
-        # Week 4
-        {'date': '2024-05-04', 'home_team': 'HFX Wanderers FC', 'away_team': 'Forge FC', 'home_goals': 0, 'away_goals': 2},
-        {'date': '2024-05-04', 'home_team': 'Atletico Ottawa', 'away_team': 'York United FC', 'home_goals': 1, 'away_goals': 0},
-        {'date': '2024-05-05', 'home_team': 'Pacific FC', 'away_team': 'Valour FC', 'home_goals': 1, 'away_goals': 1},
-        {'date': '2024-05-05', 'home_team': 'Vancouver FC', 'away_team': 'Cavalry FC', 'home_goals': 0, 'away_goals': 2},
-        # Week 5
-        {'date': '2024-05-11', 'home_team': 'Forge FC', 'away_team': 'Cavalry FC', 'home_goals': 2, 'away_goals': 2},
-        {'date': '2024-05-11', 'home_team': 'York United FC', 'away_team': 'Valour FC', 'home_goals': 0, 'away_goals': 1},
-        {'date': '2024-05-12', 'home_team': 'HFX Wanderers FC', 'away_team': 'Vancouver FC', 'home_goals': 2, 'away_goals': 1},
-        {'date': '2024-05-12', 'home_team': 'Atletico Ottawa', 'away_team': 'Pacific FC', 'home_goals': 1, 'away_goals': 2},
-        # Week 6
-        {'date': '2024-05-18', 'home_team': 'Cavalry FC', 'away_team': 'Valour FC', 'home_goals': 3, 'away_goals': 1},
-        {'date': '2024-05-18', 'home_team': 'Pacific FC', 'away_team': 'HFX Wanderers FC', 'home_goals': 2, 'away_goals': 0},
-        {'date': '2024-05-19', 'home_team': 'Vancouver FC', 'away_team': 'Atletico Ottawa', 'home_goals': 1, 'away_goals': 2},
-        {'date': '2024-05-19', 'home_team': 'Forge FC', 'away_team': 'York United FC', 'home_goals': 1, 'away_goals': 0},
-        # Week 7
-        {'date': '2024-05-25', 'home_team': 'Valour FC', 'away_team': 'Forge FC', 'home_goals': 0, 'away_goals': 3},
-        {'date': '2024-05-25', 'home_team': 'HFX Wanderers FC', 'away_team': 'Atletico Ottawa', 'home_goals': 1, 'away_goals': 1},
-        {'date': '2024-05-26', 'home_team': 'York United FC', 'away_team': 'Cavalry FC', 'home_goals': 1, 'away_goals': 2},
-        {'date': '2024-05-26', 'home_team': 'Pacific FC', 'away_team': 'Vancouver FC', 'home_goals': 3, 'away_goals': 1},
-        # Week 8
-        {'date': '2024-06-01', 'home_team': 'Atletico Ottawa', 'away_team': 'Forge FC', 'home_goals': 0, 'away_goals': 1},
-        {'date': '2024-06-01', 'home_team': 'Cavalry FC', 'away_team': 'HFX Wanderers FC', 'home_goals': 2, 'away_goals': 0},
-        {'date': '2024-06-02', 'home_team': 'Vancouver FC', 'away_team': 'Valour FC', 'home_goals': 1, 'away_goals': 3},
-        {'date': '2024-06-02', 'home_team': 'York United FC', 'away_team': 'Pacific FC', 'home_goals': 0, 'away_goals': 0},
-        # Week 9-14 (abbreviated for space - add more as needed)
-        {'date': '2024-06-08', 'home_team': 'Forge FC', 'away_team': 'Pacific FC', 'home_goals': 2, 'away_goals': 1},
-        {'date': '2024-06-15', 'home_team': 'Cavalry FC', 'away_team': 'York United FC', 'home_goals': 1, 'away_goals': 0},
-        {'date': '2024-06-22', 'home_team': 'Valour FC', 'away_team': 'Atletico Ottawa', 'home_goals': 2, 'away_goals': 2},
-        {'date': '2024-06-29', 'home_team': 'HFX Wanderers FC', 'away_team': 'Pacific FC', 'home_goals': 1, 'away_goals': 2},
-        {'date': '2024-07-06', 'home_team': 'Forge FC', 'away_team': 'HFX Wanderers FC', 'home_goals': 3, 'away_goals': 0},
-        {'date': '2024-07-13', 'home_team': 'Cavalry FC', 'away_team': 'Vancouver FC', 'home_goals': 4, 'away_goals': 0},
-        {'date': '2024-07-20', 'home_team': 'Pacific FC', 'away_team': 'Atletico Ottawa', 'home_goals': 2, 'away_goals': 1},
-        {'date': '2024-07-27', 'home_team': 'York United FC', 'away_team': 'Forge FC', 'home_goals': 1, 'away_goals': 2},
-    ]
-
-    # 2023 Season - Full season
-    season_2023 = [
-        {'date': '2023-04-15', 'home_team': 'Forge FC', 'away_team': 'Valour FC', 'home_goals': 2, 'away_goals': 0},
-        {'date': '2023-04-15', 'home_team': 'Cavalry FC', 'away_team': 'Pacific FC', 'home_goals': 1, 'away_goals': 1},
-        {'date': '2023-04-16', 'home_team': 'Atletico Ottawa', 'away_team': 'HFX Wanderers FC', 'home_goals': 2, 'away_goals': 1},
-        {'date': '2023-04-16', 'home_team': 'York United FC', 'away_team': 'FC Edmonton', 'home_goals': 2, 'away_goals': 0},
-        {'date': '2023-04-22', 'home_team': 'Pacific FC', 'away_team': 'Forge FC', 'home_goals': 1, 'away_goals': 3},
-        {'date': '2023-04-22', 'home_team': 'HFX Wanderers FC', 'away_team': 'Cavalry FC', 'home_goals': 0, 'away_goals': 2},
-        {'date': '2023-04-23', 'home_team': 'Valour FC', 'away_team': 'Atletico Ottawa', 'home_goals': 1, 'away_goals': 1},
-        {'date': '2023-04-23', 'home_team': 'FC Edmonton', 'away_team': 'Pacific FC', 'home_goals': 0, 'away_goals': 2},
-        {'date': '2023-04-29', 'home_team': 'Forge FC', 'away_team': 'York United FC', 'home_goals': 2, 'away_goals': 0},
-        {'date': '2023-04-29', 'home_team': 'Cavalry FC', 'away_team': 'Atletico Ottawa', 'home_goals': 2, 'away_goals': 1},
-        {'date': '2023-05-06', 'home_team': 'HFX Wanderers FC', 'away_team': 'Valour FC', 'home_goals': 1, 'away_goals': 2},
-        {'date': '2023-05-06', 'home_team': 'Pacific FC', 'away_team': 'FC Edmonton', 'home_goals': 3, 'away_goals': 0},
-        {'date': '2023-05-13', 'home_team': 'Forge FC', 'away_team': 'Cavalry FC', 'home_goals': 1, 'away_goals': 1},
-        {'date': '2023-05-13', 'home_team': 'Atletico Ottawa', 'away_team': 'Pacific FC', 'home_goals': 0, 'away_goals': 1},
-        {'date': '2023-05-20', 'home_team': 'York United FC', 'away_team': 'HFX Wanderers FC', 'home_goals': 2, 'away_goals': 1},
-        {'date': '2023-05-20', 'home_team': 'Valour FC', 'away_team': 'Cavalry FC', 'home_goals': 0, 'away_goals': 3},
-        {'date': '2023-05-27', 'home_team': 'FC Edmonton', 'away_team': 'Forge FC', 'home_goals': 1, 'away_goals': 4},
-        {'date': '2023-05-27', 'home_team': 'Pacific FC', 'away_team': 'HFX Wanderers FC', 'home_goals': 2, 'away_goals': 1},
-        {'date': '2023-06-03', 'home_team': 'Cavalry FC', 'away_team': 'Valour FC', 'home_goals': 2, 'away_goals': 0},
-        {'date': '2023-06-03', 'home_team': 'Atletico Ottawa', 'away_team': 'York United FC', 'home_goals': 1, 'away_goals': 0},
-        {'date': '2023-06-10', 'home_team': 'Forge FC', 'away_team': 'HFX Wanderers FC', 'home_goals': 3, 'away_goals': 1},
-        {'date': '2023-06-10', 'home_team': 'FC Edmonton', 'away_team': 'Cavalry FC', 'home_goals': 0, 'away_goals': 2},
-        {'date': '2023-06-17', 'home_team': 'Pacific FC', 'away_team': 'Atletico Ottawa', 'home_goals': 2, 'away_goals': 2},
-        {'date': '2023-06-17', 'home_team': 'Valour FC', 'away_team': 'York United FC', 'home_goals': 1, 'away_goals': 1},
-        {'date': '2023-06-24', 'home_team': 'HFX Wanderers FC', 'away_team': 'FC Edmonton', 'home_goals': 3, 'away_goals': 0},
-        {'date': '2023-06-24', 'home_team': 'Cavalry FC', 'away_team': 'Forge FC', 'home_goals': 0, 'away_goals': 1},
-        {'date': '2023-07-01', 'home_team': 'York United FC', 'away_team': 'Pacific FC', 'home_goals': 1, 'away_goals': 2},
-        {'date': '2023-07-01', 'home_team': 'Atletico Ottawa', 'away_team': 'Valour FC', 'home_goals': 2, 'away_goals': 1},
-        {'date': '2023-07-08', 'home_team': 'Forge FC', 'away_team': 'FC Edmonton', 'home_goals': 5, 'away_goals': 0},
-        {'date': '2023-07-08', 'home_team': 'HFX Wanderers FC', 'away_team': 'Atletico Ottawa', 'home_goals': 0, 'away_goals': 1},
-        {'date': '2023-07-15', 'home_team': 'Cavalry FC', 'away_team': 'York United FC', 'home_goals': 3, 'away_goals': 1},
-        {'date': '2023-07-15', 'home_team': 'Valour FC', 'away_team': 'Pacific FC', 'home_goals': 2, 'away_goals': 2},
-    ]
-
-    # 2022 Season - Forge FC champions
-    season_2022 = [
-        {'date': '2022-04-07', 'home_team': 'Forge FC', 'away_team': 'Cavalry FC', 'home_goals': 2, 'away_goals': 0},
-        {'date': '2022-04-09', 'home_team': 'Pacific FC', 'away_team': 'HFX Wanderers FC', 'home_goals': 1, 'away_goals': 0},
-        {'date': '2022-04-10', 'home_team': 'York United FC', 'away_team': 'Atletico Ottawa', 'home_goals': 0, 'away_goals': 1},
-        {'date': '2022-04-10', 'home_team': 'Valour FC', 'away_team': 'FC Edmonton', 'home_goals': 2, 'away_goals': 1},
-        {'date': '2022-04-16', 'home_team': 'Cavalry FC', 'away_team': 'Pacific FC', 'home_goals': 3, 'away_goals': 1},
-        {'date': '2022-04-16', 'home_team': 'HFX Wanderers FC', 'away_team': 'York United FC', 'home_goals': 2, 'away_goals': 2},
-        {'date': '2022-04-17', 'home_team': 'FC Edmonton', 'away_team': 'Forge FC', 'home_goals': 0, 'away_goals': 3},
-        {'date': '2022-04-17', 'home_team': 'Atletico Ottawa', 'away_team': 'Valour FC', 'home_goals': 1, 'away_goals': 0},
-        {'date': '2022-04-23', 'home_team': 'Forge FC', 'away_team': 'Pacific FC', 'home_goals': 2, 'away_goals': 1},
-        {'date': '2022-04-23', 'home_team': 'York United FC', 'away_team': 'Cavalry FC', 'home_goals': 1, 'away_goals': 2},
-        {'date': '2022-04-24', 'home_team': 'Valour FC', 'away_team': 'HFX Wanderers FC', 'home_goals': 1, 'away_goals': 1},
-        {'date': '2022-04-24', 'home_team': 'FC Edmonton', 'away_team': 'Atletico Ottawa', 'home_goals': 0, 'away_goals': 2},
-        {'date': '2022-04-30', 'home_team': 'Cavalry FC', 'away_team': 'Valour FC', 'home_goals': 4, 'away_goals': 0},
-        {'date': '2022-04-30', 'home_team': 'Pacific FC', 'away_team': 'York United FC', 'home_goals': 2, 'away_goals': 0},
-        {'date': '2022-05-01', 'home_team': 'HFX Wanderers FC', 'away_team': 'Forge FC', 'home_goals': 1, 'away_goals': 2},
-        {'date': '2022-05-01', 'home_team': 'Atletico Ottawa', 'away_team': 'FC Edmonton', 'home_goals': 3, 'away_goals': 1},
-        {'date': '2022-05-07', 'home_team': 'Forge FC', 'away_team': 'Valour FC', 'home_goals': 1, 'away_goals': 0},
-        {'date': '2022-05-07', 'home_team': 'York United FC', 'away_team': 'FC Edmonton', 'home_goals': 2, 'away_goals': 0},
-        {'date': '2022-05-08', 'home_team': 'Cavalry FC', 'away_team': 'HFX Wanderers FC', 'home_goals': 2, 'away_goals': 1},
-        {'date': '2022-05-08', 'home_team': 'Pacific FC', 'away_team': 'Atletico Ottawa', 'home_goals': 1, 'away_goals': 1},
-        {'date': '2022-05-14', 'home_team': 'Valour FC', 'away_team': 'Cavalry FC', 'home_goals': 0, 'away_goals': 1},
-        {'date': '2022-05-14', 'home_team': 'HFX Wanderers FC', 'away_team': 'Pacific FC', 'home_goals': 0, 'away_goals': 2},
-        {'date': '2022-05-15', 'home_team': 'FC Edmonton', 'away_team': 'York United FC', 'home_goals': 1, 'away_goals': 3},
-        {'date': '2022-05-15', 'home_team': 'Atletico Ottawa', 'away_team': 'Forge FC', 'home_goals': 0, 'away_goals': 2},
-        {'date': '2022-05-21', 'home_team': 'Cavalry FC', 'away_team': 'Atletico Ottawa', 'home_goals': 2, 'away_goals': 0},
-        {'date': '2022-05-21', 'home_team': 'Pacific FC', 'away_team': 'Valour FC', 'home_goals': 3, 'away_goals': 2},
-        {'date': '2022-05-22', 'home_team': 'Forge FC', 'away_team': 'York United FC', 'home_goals': 2, 'away_goals': 1},
-        {'date': '2022-05-22', 'home_team': 'HFX Wanderers FC', 'away_team': 'FC Edmonton', 'home_goals': 4, 'away_goals': 0},
-        {'date': '2022-05-28', 'home_team': 'York United FC', 'away_team': 'Valour FC', 'home_goals': 1, 'away_goals': 2},
-        {'date': '2022-05-28', 'home_team': 'Atletico Ottawa', 'away_team': 'Pacific FC', 'home_goals': 2, 'away_goals': 2},
-        {'date': '2022-05-29', 'home_team': 'FC Edmonton', 'away_team': 'Cavalry FC', 'home_goals': 0, 'away_goals': 3},
-        {'date': '2022-05-29', 'home_team': 'Valour FC', 'away_team': 'Forge FC', 'home_goals': 1, 'away_goals': 1},
-    ]
-
-    # 2021 Season - Pacific FC champions
-    season_2021 = [
-        {'date': '2021-06-26', 'home_team': 'Forge FC', 'away_team': 'HFX Wanderers FC', 'home_goals': 2, 'away_goals': 1},
-        {'date': '2021-06-26', 'home_team': 'Valour FC', 'away_team': 'Pacific FC', 'home_goals': 0, 'away_goals': 2},
-        {'date': '2021-06-27', 'home_team': 'Cavalry FC', 'away_team': 'Atletico Ottawa', 'home_goals': 1, 'away_goals': 0},
-        {'date': '2021-06-27', 'home_team': 'York United FC', 'away_team': 'FC Edmonton', 'home_goals': 2, 'away_goals': 2},
-        {'date': '2021-07-03', 'home_team': 'Pacific FC', 'away_team': 'Forge FC', 'home_goals': 1, 'away_goals': 1},
-        {'date': '2021-07-03', 'home_team': 'HFX Wanderers FC', 'away_team': 'Cavalry FC', 'home_goals': 0, 'away_goals': 2},
-        {'date': '2021-07-04', 'home_team': 'FC Edmonton', 'away_team': 'Valour FC', 'home_goals': 1, 'away_goals': 3},
-        {'date': '2021-07-04', 'home_team': 'Atletico Ottawa', 'away_team': 'York United FC', 'home_goals': 2, 'away_goals': 0},
-        {'date': '2021-07-10', 'home_team': 'Forge FC', 'away_team': 'Atletico Ottawa', 'home_goals': 3, 'away_goals': 0},
-        {'date': '2021-07-10', 'home_team': 'Cavalry FC', 'away_team': 'Valour FC', 'home_goals': 2, 'away_goals': 1},
-        {'date': '2021-07-11', 'home_team': 'Pacific FC', 'away_team': 'FC Edmonton', 'home_goals': 4, 'away_goals': 0},
-        {'date': '2021-07-11', 'home_team': 'York United FC', 'away_team': 'HFX Wanderers FC', 'home_goals': 1, 'away_goals': 1},
-        {'date': '2021-07-17', 'home_team': 'Valour FC', 'away_team': 'Forge FC', 'home_goals': 0, 'away_goals': 2},
-        {'date': '2021-07-17', 'home_team': 'HFX Wanderers FC', 'away_team': 'Pacific FC', 'home_goals': 1, 'away_goals': 3},
-        {'date': '2021-07-18', 'home_team': 'Atletico Ottawa', 'away_team': 'Cavalry FC', 'home_goals': 1, 'away_goals': 1},
-        {'date': '2021-07-18', 'home_team': 'FC Edmonton', 'away_team': 'York United FC', 'home_goals': 0, 'away_goals': 1},
-        {'date': '2021-07-24', 'home_team': 'Forge FC', 'away_team': 'FC Edmonton', 'home_goals': 5, 'away_goals': 1},
-        {'date': '2021-07-24', 'home_team': 'Pacific FC', 'away_team': 'Atletico Ottawa', 'home_goals': 2, 'away_goals': 0},
-        {'date': '2021-07-25', 'home_team': 'Cavalry FC', 'away_team': 'York United FC', 'home_goals': 3, 'away_goals': 0},
-        {'date': '2021-07-25', 'home_team': 'Valour FC', 'away_team': 'HFX Wanderers FC', 'home_goals': 2, 'away_goals': 2},
-        {'date': '2021-07-31', 'home_team': 'York United FC', 'away_team': 'Forge FC', 'home_goals': 0, 'away_goals': 2},
-        {'date': '2021-07-31', 'home_team': 'Atletico Ottawa', 'away_team': 'Valour FC', 'home_goals': 1, 'away_goals': 1},
-        {'date': '2021-08-01', 'home_team': 'HFX Wanderers FC', 'away_team': 'FC Edmonton', 'home_goals': 2, 'away_goals': 0},
-        {'date': '2021-08-01', 'home_team': 'Pacific FC', 'away_team': 'Cavalry FC', 'home_goals': 2, 'away_goals': 1},
-        {'date': '2021-08-07', 'home_team': 'Forge FC', 'away_team': 'Cavalry FC', 'home_goals': 1, 'away_goals': 0},
-        {'date': '2021-08-07', 'home_team': 'FC Edmonton', 'away_team': 'Atletico Ottawa', 'home_goals': 1, 'away_goals': 2},
-        {'date': '2021-08-08', 'home_team': 'Valour FC', 'away_team': 'York United FC', 'home_goals': 3, 'away_goals': 1},
-        {'date': '2021-08-08', 'home_team': 'HFX Wanderers FC', 'away_team': 'Pacific FC', 'home_goals': 0, 'away_goals': 1},
-        {'date': '2021-08-14', 'home_team': 'Cavalry FC', 'away_team': 'Forge FC', 'home_goals': 1, 'away_goals': 2},
-        {'date': '2021-08-14', 'home_team': 'York United FC', 'away_team': 'Pacific FC', 'home_goals': 1, 'away_goals': 3},
-        {'date': '2021-08-15', 'home_team': 'Atletico Ottawa', 'away_team': 'HFX Wanderers FC', 'home_goals': 2, 'away_goals': 1},
-        {'date': '2021-08-15', 'home_team': 'FC Edmonton', 'away_team': 'Valour FC', 'home_goals': 0, 'away_goals': 2},
-    ]
-
-    # 2020 Season - Island Games (COVID bubble in PEI) - Forge FC champions
-    season_2020 = [
-        {'date': '2020-08-13', 'home_team': 'Forge FC', 'away_team': 'Cavalry FC', 'home_goals': 2, 'away_goals': 0},
-        {'date': '2020-08-13', 'home_team': 'Pacific FC', 'away_team': 'FC Edmonton', 'home_goals': 1, 'away_goals': 0},
-        {'date': '2020-08-15', 'home_team': 'York United FC', 'away_team': 'HFX Wanderers FC', 'home_goals': 2, 'away_goals': 1},
-        {'date': '2020-08-15', 'home_team': 'Valour FC', 'away_team': 'Atletico Ottawa', 'home_goals': 0, 'away_goals': 1},
-        {'date': '2020-08-16', 'home_team': 'Cavalry FC', 'away_team': 'Pacific FC', 'home_goals': 3, 'away_goals': 0},
-        {'date': '2020-08-16', 'home_team': 'HFX Wanderers FC', 'away_team': 'Forge FC', 'home_goals': 1, 'away_goals': 2},
-        {'date': '2020-08-19', 'home_team': 'Atletico Ottawa', 'away_team': 'York United FC', 'home_goals': 1, 'away_goals': 1},
-        {'date': '2020-08-19', 'home_team': 'FC Edmonton', 'away_team': 'Valour FC', 'home_goals': 0, 'away_goals': 0},
-        {'date': '2020-08-20', 'home_team': 'Forge FC', 'away_team': 'Pacific FC', 'home_goals': 1, 'away_goals': 0},
-        {'date': '2020-08-20', 'home_team': 'Cavalry FC', 'away_team': 'HFX Wanderers FC', 'home_goals': 2, 'away_goals': 1},
-        {'date': '2020-08-22', 'home_team': 'York United FC', 'away_team': 'Valour FC', 'home_goals': 1, 'away_goals': 0},
-        {'date': '2020-08-22', 'home_team': 'Atletico Ottawa', 'away_team': 'FC Edmonton', 'home_goals': 2, 'away_goals': 0},
-        {'date': '2020-08-23', 'home_team': 'HFX Wanderers FC', 'away_team': 'Pacific FC', 'home_goals': 1, 'away_goals': 1},
-        {'date': '2020-08-23', 'home_team': 'Forge FC', 'away_team': 'Cavalry FC', 'home_goals': 0, 'away_goals': 0},
-        {'date': '2020-08-25', 'home_team': 'Valour FC', 'away_team': 'York United FC', 'home_goals': 2, 'away_goals': 3},
-        {'date': '2020-08-25', 'home_team': 'FC Edmonton', 'away_team': 'Atletico Ottawa', 'home_goals': 1, 'away_goals': 2},
-        {'date': '2020-08-27', 'home_team': 'Pacific FC', 'away_team': 'Forge FC', 'home_goals': 0, 'away_goals': 1},
-        {'date': '2020-08-27', 'home_team': 'HFX Wanderers FC', 'away_team': 'Cavalry FC', 'home_goals': 0, 'away_goals': 2},
-        {'date': '2020-08-29', 'home_team': 'York United FC', 'away_team': 'FC Edmonton', 'home_goals': 1, 'away_goals': 0},
-        {'date': '2020-08-29', 'home_team': 'Valour FC', 'away_team': 'Atletico Ottawa', 'home_goals': 1, 'away_goals': 1},
-        {'date': '2020-08-30', 'home_team': 'Cavalry FC', 'away_team': 'Pacific FC', 'home_goals': 2, 'away_goals': 1},
-        {'date': '2020-08-30', 'home_team': 'Forge FC', 'away_team': 'HFX Wanderers FC', 'home_goals': 3, 'away_goals': 0},
-        {'date': '2020-09-01', 'home_team': 'Atletico Ottawa', 'away_team': 'Valour FC', 'home_goals': 0, 'away_goals': 0},
-        {'date': '2020-09-01', 'home_team': 'FC Edmonton', 'away_team': 'York United FC', 'home_goals': 1, 'away_goals': 2},
-    ]
-
-    # 2019 Season - Inaugural season - Forge FC champions (7 teams, no Ottawa)
-    season_2019 = [
-        {'date': '2019-04-27', 'home_team': 'Forge FC', 'away_team': 'York United FC', 'home_goals': 1, 'away_goals': 1},
-        {'date': '2019-04-28', 'home_team': 'Cavalry FC', 'away_team': 'Pacific FC', 'home_goals': 1, 'away_goals': 0},
-        {'date': '2019-04-28', 'home_team': 'Valour FC', 'away_team': 'FC Edmonton', 'home_goals': 2, 'away_goals': 1},
-        {'date': '2019-05-01', 'home_team': 'HFX Wanderers FC', 'away_team': 'Forge FC', 'home_goals': 1, 'away_goals': 2},
-        {'date': '2019-05-04', 'home_team': 'York United FC', 'away_team': 'Cavalry FC', 'home_goals': 2, 'away_goals': 2},
-        {'date': '2019-05-04', 'home_team': 'Pacific FC', 'away_team': 'Valour FC', 'home_goals': 1, 'away_goals': 1},
-        {'date': '2019-05-05', 'home_team': 'FC Edmonton', 'away_team': 'HFX Wanderers FC', 'home_goals': 0, 'away_goals': 0},
-        {'date': '2019-05-11', 'home_team': 'Forge FC', 'away_team': 'Pacific FC', 'home_goals': 3, 'away_goals': 1},
-        {'date': '2019-05-11', 'home_team': 'Cavalry FC', 'away_team': 'Valour FC', 'home_goals': 2, 'away_goals': 0},
-        {'date': '2019-05-12', 'home_team': 'HFX Wanderers FC', 'away_team': 'York United FC', 'home_goals': 2, 'away_goals': 1},
-        {'date': '2019-05-15', 'home_team': 'FC Edmonton', 'away_team': 'Forge FC', 'home_goals': 1, 'away_goals': 2},
-        {'date': '2019-05-18', 'home_team': 'Valour FC', 'away_team': 'HFX Wanderers FC', 'home_goals': 1, 'away_goals': 0},
-        {'date': '2019-05-18', 'home_team': 'Pacific FC', 'away_team': 'York United FC', 'home_goals': 0, 'away_goals': 2},
-        {'date': '2019-05-19', 'home_team': 'Cavalry FC', 'away_team': 'FC Edmonton', 'home_goals': 3, 'away_goals': 0},
-        {'date': '2019-05-25', 'home_team': 'Forge FC', 'away_team': 'Valour FC', 'home_goals': 1, 'away_goals': 0},
-        {'date': '2019-05-25', 'home_team': 'York United FC', 'away_team': 'Pacific FC', 'home_goals': 1, 'away_goals': 1},
-        {'date': '2019-05-26', 'home_team': 'HFX Wanderers FC', 'away_team': 'Cavalry FC', 'home_goals': 1, 'away_goals': 2},
-        {'date': '2019-06-01', 'home_team': 'FC Edmonton', 'away_team': 'York United FC', 'home_goals': 0, 'away_goals': 0},
-        {'date': '2019-06-01', 'home_team': 'Pacific FC', 'away_team': 'HFX Wanderers FC', 'home_goals': 1, 'away_goals': 0},
-        {'date': '2019-06-02', 'home_team': 'Valour FC', 'away_team': 'Cavalry FC', 'home_goals': 1, 'away_goals': 3},
-        {'date': '2019-06-08', 'home_team': 'Cavalry FC', 'away_team': 'Forge FC', 'home_goals': 1, 'away_goals': 1},
-        {'date': '2019-06-08', 'home_team': 'York United FC', 'away_team': 'Valour FC', 'home_goals': 2, 'away_goals': 1},
-        {'date': '2019-06-09', 'home_team': 'HFX Wanderers FC', 'away_team': 'Pacific FC', 'home_goals': 2, 'away_goals': 2},
-        {'date': '2019-06-15', 'home_team': 'Forge FC', 'away_team': 'FC Edmonton', 'home_goals': 4, 'away_goals': 0},
-        {'date': '2019-06-15', 'home_team': 'Valour FC', 'away_team': 'Pacific FC', 'home_goals': 0, 'away_goals': 1},
-        {'date': '2019-06-16', 'home_team': 'Cavalry FC', 'away_team': 'HFX Wanderers FC', 'home_goals': 1, 'away_goals': 0},
-        {'date': '2019-06-22', 'home_team': 'Pacific FC', 'away_team': 'Cavalry FC', 'home_goals': 0, 'away_goals': 2},
-        {'date': '2019-06-22', 'home_team': 'FC Edmonton', 'away_team': 'Valour FC', 'home_goals': 2, 'away_goals': 2},
-        {'date': '2019-06-23', 'home_team': 'York United FC', 'away_team': 'HFX Wanderers FC', 'home_goals': 1, 'away_goals': 0},
-        {'date': '2019-06-26', 'home_team': 'HFX Wanderers FC', 'away_team': 'FC Edmonton', 'home_goals': 1, 'away_goals': 1},
-        {'date': '2019-06-29', 'home_team': 'Forge FC', 'away_team': 'Cavalry FC', 'home_goals': 2, 'away_goals': 1},
-        {'date': '2019-06-29', 'home_team': 'Valour FC', 'away_team': 'York United FC', 'home_goals': 1, 'away_goals': 0},
-    ]
-
-    # 2025 Season - Competitive season with Forge FC winning (8 teams, no FC Edmonton)
-    # More realistic results with upsets, close games, and balanced competition
-    season_2025 = [
-        # Week 1
-        {'date': '2025-04-12', 'home_team': 'Forge FC', 'away_team': 'Vancouver FC', 'home_goals': 2, 'away_goals': 0},
-        {'date': '2025-04-12', 'home_team': 'Cavalry FC', 'away_team': 'York United FC', 'home_goals': 1, 'away_goals': 1},
-        {'date': '2025-04-13', 'home_team': 'Pacific FC', 'away_team': 'Atletico Ottawa', 'home_goals': 2, 'away_goals': 1},
-        {'date': '2025-04-13', 'home_team': 'Valour FC', 'away_team': 'HFX Wanderers FC', 'home_goals': 1, 'away_goals': 0},
-        # Week 2
-        {'date': '2025-04-19', 'home_team': 'Vancouver FC', 'away_team': 'Cavalry FC', 'home_goals': 1, 'away_goals': 2},
-        {'date': '2025-04-19', 'home_team': 'York United FC', 'away_team': 'Pacific FC', 'home_goals': 0, 'away_goals': 1},
-        {'date': '2025-04-20', 'home_team': 'Atletico Ottawa', 'away_team': 'Forge FC', 'home_goals': 1, 'away_goals': 1},
-        {'date': '2025-04-20', 'home_team': 'HFX Wanderers FC', 'away_team': 'Valour FC', 'home_goals': 2, 'away_goals': 2},
-        # Week 3
-        {'date': '2025-04-26', 'home_team': 'Forge FC', 'away_team': 'York United FC', 'home_goals': 3, 'away_goals': 1},
-        {'date': '2025-04-26', 'home_team': 'Cavalry FC', 'away_team': 'Atletico Ottawa', 'home_goals': 2, 'away_goals': 1},
-        {'date': '2025-04-27', 'home_team': 'Pacific FC', 'away_team': 'HFX Wanderers FC', 'home_goals': 1, 'away_goals': 1},
-        {'date': '2025-04-27', 'home_team': 'Valour FC', 'away_team': 'Vancouver FC', 'home_goals': 2, 'away_goals': 1},
-        # Week 4
-        {'date': '2025-05-03', 'home_team': 'York United FC', 'away_team': 'Valour FC', 'home_goals': 1, 'away_goals': 1},
-        {'date': '2025-05-03', 'home_team': 'Atletico Ottawa', 'away_team': 'Pacific FC', 'home_goals': 0, 'away_goals': 0},
-        {'date': '2025-05-04', 'home_team': 'HFX Wanderers FC', 'away_team': 'Forge FC', 'home_goals': 0, 'away_goals': 2},
-        {'date': '2025-05-04', 'home_team': 'Vancouver FC', 'away_team': 'Cavalry FC', 'home_goals': 0, 'away_goals': 1},
-        # Week 5
-        {'date': '2025-05-10', 'home_team': 'Forge FC', 'away_team': 'Cavalry FC', 'home_goals': 2, 'away_goals': 1},
-        {'date': '2025-05-10', 'home_team': 'Pacific FC', 'away_team': 'Valour FC', 'home_goals': 3, 'away_goals': 2},
-        {'date': '2025-05-11', 'home_team': 'Atletico Ottawa', 'away_team': 'HFX Wanderers FC', 'home_goals': 2, 'away_goals': 0},
-        {'date': '2025-05-11', 'home_team': 'York United FC', 'away_team': 'Vancouver FC', 'home_goals': 1, 'away_goals': 0},
-        # Week 6
-        {'date': '2025-05-17', 'home_team': 'Cavalry FC', 'away_team': 'Pacific FC', 'home_goals': 1, 'away_goals': 1},
-        {'date': '2025-05-17', 'home_team': 'Valour FC', 'away_team': 'Atletico Ottawa', 'home_goals': 0, 'away_goals': 1},
-        {'date': '2025-05-18', 'home_team': 'HFX Wanderers FC', 'away_team': 'York United FC', 'home_goals': 1, 'away_goals': 2},
-        {'date': '2025-05-18', 'home_team': 'Vancouver FC', 'away_team': 'Forge FC', 'home_goals': 0, 'away_goals': 3},
-        # Week 7
-        {'date': '2025-05-24', 'home_team': 'Forge FC', 'away_team': 'Pacific FC', 'home_goals': 1, 'away_goals': 2},
-        {'date': '2025-05-24', 'home_team': 'Cavalry FC', 'away_team': 'HFX Wanderers FC', 'home_goals': 2, 'away_goals': 0},
-        {'date': '2025-05-25', 'home_team': 'Atletico Ottawa', 'away_team': 'Vancouver FC', 'home_goals': 3, 'away_goals': 1},
-        {'date': '2025-05-25', 'home_team': 'Valour FC', 'away_team': 'York United FC', 'home_goals': 2, 'away_goals': 1},
-        # Week 8
-        {'date': '2025-05-31', 'home_team': 'Pacific FC', 'away_team': 'Forge FC', 'home_goals': 0, 'away_goals': 1},
-        {'date': '2025-05-31', 'home_team': 'HFX Wanderers FC', 'away_team': 'Cavalry FC', 'home_goals': 1, 'away_goals': 3},
-        {'date': '2025-06-01', 'home_team': 'York United FC', 'away_team': 'Atletico Ottawa', 'home_goals': 2, 'away_goals': 2},
-        {'date': '2025-06-01', 'home_team': 'Vancouver FC', 'away_team': 'Valour FC', 'home_goals': 1, 'away_goals': 1},
-        # Week 9
-        {'date': '2025-06-07', 'home_team': 'Forge FC', 'away_team': 'Valour FC', 'home_goals': 2, 'away_goals': 0},
-        {'date': '2025-06-07', 'home_team': 'Cavalry FC', 'away_team': 'Vancouver FC', 'home_goals': 3, 'away_goals': 0},
-        {'date': '2025-06-08', 'home_team': 'Pacific FC', 'away_team': 'York United FC', 'home_goals': 1, 'away_goals': 0},
-        {'date': '2025-06-08', 'home_team': 'Atletico Ottawa', 'away_team': 'HFX Wanderers FC', 'home_goals': 1, 'away_goals': 1},
-        # Week 10
-        {'date': '2025-06-14', 'home_team': 'Valour FC', 'away_team': 'Forge FC', 'home_goals': 1, 'away_goals': 2},
-        {'date': '2025-06-14', 'home_team': 'HFX Wanderers FC', 'away_team': 'Pacific FC', 'home_goals': 0, 'away_goals': 2},
-        {'date': '2025-06-15', 'home_team': 'York United FC', 'away_team': 'Cavalry FC', 'home_goals': 1, 'away_goals': 1},
-        {'date': '2025-06-15', 'home_team': 'Vancouver FC', 'away_team': 'Atletico Ottawa', 'home_goals': 2, 'away_goals': 2},
-        # Week 11
-        {'date': '2025-06-21', 'home_team': 'Forge FC', 'away_team': 'Atletico Ottawa', 'home_goals': 1, 'away_goals': 0},
-        {'date': '2025-06-21', 'home_team': 'Cavalry FC', 'away_team': 'Valour FC', 'home_goals': 2, 'away_goals': 1},
-        {'date': '2025-06-22', 'home_team': 'Pacific FC', 'away_team': 'Vancouver FC', 'home_goals': 2, 'away_goals': 0},
-        {'date': '2025-06-22', 'home_team': 'HFX Wanderers FC', 'away_team': 'York United FC', 'home_goals': 0, 'away_goals': 1},
-        # Week 12
-        {'date': '2025-06-28', 'home_team': 'Atletico Ottawa', 'away_team': 'Cavalry FC', 'home_goals': 2, 'away_goals': 2},
-        {'date': '2025-06-28', 'home_team': 'Valour FC', 'away_team': 'Pacific FC', 'home_goals': 1, 'away_goals': 3},
-        {'date': '2025-06-29', 'home_team': 'York United FC', 'away_team': 'Forge FC', 'home_goals': 0, 'away_goals': 1},
-        {'date': '2025-06-29', 'home_team': 'Vancouver FC', 'away_team': 'HFX Wanderers FC', 'home_goals': 1, 'away_goals': 0},
-        # Week 13
-        {'date': '2025-07-05', 'home_team': 'Forge FC', 'away_team': 'HFX Wanderers FC', 'home_goals': 2, 'away_goals': 1},
-        {'date': '2025-07-05', 'home_team': 'Cavalry FC', 'away_team': 'Pacific FC', 'home_goals': 0, 'away_goals': 0},
-        {'date': '2025-07-06', 'home_team': 'Atletico Ottawa', 'away_team': 'Valour FC', 'home_goals': 1, 'away_goals': 0},
-        {'date': '2025-07-06', 'home_team': 'York United FC', 'away_team': 'Vancouver FC', 'home_goals': 2, 'away_goals': 1},
-        # Week 14
-        {'date': '2025-07-12', 'home_team': 'Pacific FC', 'away_team': 'Cavalry FC', 'home_goals': 2, 'away_goals': 1},
-        {'date': '2025-07-12', 'home_team': 'HFX Wanderers FC', 'away_team': 'Atletico Ottawa', 'home_goals': 1, 'away_goals': 3},
-        {'date': '2025-07-13', 'home_team': 'Valour FC', 'away_team': 'Forge FC', 'home_goals': 0, 'away_goals': 0},
-        {'date': '2025-07-13', 'home_team': 'Vancouver FC', 'away_team': 'York United FC', 'home_goals': 1, 'away_goals': 2},
-        # Week 15
-        {'date': '2025-07-19', 'home_team': 'Forge FC', 'away_team': 'Pacific FC', 'home_goals': 2, 'away_goals': 1},
-        {'date': '2025-07-19', 'home_team': 'Cavalry FC', 'away_team': 'York United FC', 'home_goals': 1, 'away_goals': 0},
-        {'date': '2025-07-20', 'home_team': 'Atletico Ottawa', 'away_team': 'Vancouver FC', 'home_goals': 2, 'away_goals': 0},
-        {'date': '2025-07-20', 'home_team': 'HFX Wanderers FC', 'away_team': 'Valour FC', 'home_goals': 1, 'away_goals': 1},
-        # Week 16
-        {'date': '2025-07-26', 'home_team': 'Pacific FC', 'away_team': 'Atletico Ottawa', 'home_goals': 1, 'away_goals': 1},
-        {'date': '2025-07-26', 'home_team': 'Valour FC', 'away_team': 'Cavalry FC', 'home_goals': 0, 'away_goals': 2},
-        {'date': '2025-07-27', 'home_team': 'York United FC', 'away_team': 'HFX Wanderers FC', 'home_goals': 3, 'away_goals': 2},
-        {'date': '2025-07-27', 'home_team': 'Vancouver FC', 'away_team': 'Forge FC', 'home_goals': 1, 'away_goals': 2},
-        # Week 17
-        {'date': '2025-08-02', 'home_team': 'Forge FC', 'away_team': 'Cavalry FC', 'home_goals': 1, 'away_goals': 1},
-        {'date': '2025-08-02', 'home_team': 'Atletico Ottawa', 'away_team': 'York United FC', 'home_goals': 0, 'away_goals': 0},
-        {'date': '2025-08-03', 'home_team': 'HFX Wanderers FC', 'away_team': 'Vancouver FC', 'home_goals': 2, 'away_goals': 1},
-        {'date': '2025-08-03', 'home_team': 'Pacific FC', 'away_team': 'Valour FC', 'home_goals': 1, 'away_goals': 0},
-        # Week 18
-        {'date': '2025-08-09', 'home_team': 'Cavalry FC', 'away_team': 'Forge FC', 'home_goals': 2, 'away_goals': 2},
-        {'date': '2025-08-09', 'home_team': 'Valour FC', 'away_team': 'Atletico Ottawa', 'home_goals': 1, 'away_goals': 1},
-        {'date': '2025-08-10', 'home_team': 'York United FC', 'away_team': 'Pacific FC', 'home_goals': 0, 'away_goals': 1},
-        {'date': '2025-08-10', 'home_team': 'Vancouver FC', 'away_team': 'HFX Wanderers FC', 'home_goals': 0, 'away_goals': 2},
-        # Week 19
-        {'date': '2025-08-16', 'home_team': 'Forge FC', 'away_team': 'York United FC', 'home_goals': 2, 'away_goals': 0},
-        {'date': '2025-08-16', 'home_team': 'Pacific FC', 'away_team': 'HFX Wanderers FC', 'home_goals': 3, 'away_goals': 1},
-        {'date': '2025-08-17', 'home_team': 'Atletico Ottawa', 'away_team': 'Cavalry FC', 'home_goals': 1, 'away_goals': 2},
-        {'date': '2025-08-17', 'home_team': 'Valour FC', 'away_team': 'Vancouver FC', 'home_goals': 2, 'away_goals': 0},
-        # Week 20
-        {'date': '2025-08-23', 'home_team': 'Cavalry FC', 'away_team': 'Atletico Ottawa', 'home_goals': 1, 'away_goals': 0},
-        {'date': '2025-08-23', 'home_team': 'HFX Wanderers FC', 'away_team': 'Forge FC', 'home_goals': 1, 'away_goals': 3},
-        {'date': '2025-08-24', 'home_team': 'York United FC', 'away_team': 'Valour FC', 'home_goals': 2, 'away_goals': 2},
-        {'date': '2025-08-24', 'home_team': 'Vancouver FC', 'away_team': 'Pacific FC', 'home_goals': 0, 'away_goals': 2},
-        # Week 21
-        {'date': '2025-08-30', 'home_team': 'Forge FC', 'away_team': 'Atletico Ottawa', 'home_goals': 1, 'away_goals': 1},
-        {'date': '2025-08-30', 'home_team': 'Pacific FC', 'away_team': 'Cavalry FC', 'home_goals': 1, 'away_goals': 1},
-        {'date': '2025-08-31', 'home_team': 'Valour FC', 'away_team': 'HFX Wanderers FC', 'home_goals': 3, 'away_goals': 0},
-        {'date': '2025-08-31', 'home_team': 'York United FC', 'away_team': 'Vancouver FC', 'home_goals': 1, 'away_goals': 0},
-        # Week 22
-        {'date': '2025-09-06', 'home_team': 'Atletico Ottawa', 'away_team': 'Pacific FC', 'home_goals': 2, 'away_goals': 1},
-        {'date': '2025-09-06', 'home_team': 'Cavalry FC', 'away_team': 'Valour FC', 'home_goals': 2, 'away_goals': 0},
-        {'date': '2025-09-07', 'home_team': 'HFX Wanderers FC', 'away_team': 'York United FC', 'home_goals': 1, 'away_goals': 1},
-        {'date': '2025-09-07', 'home_team': 'Vancouver FC', 'away_team': 'Forge FC', 'home_goals': 0, 'away_goals': 2},
-        # Week 23
-        {'date': '2025-09-13', 'home_team': 'Forge FC', 'away_team': 'Valour FC', 'home_goals': 2, 'away_goals': 1},
-        {'date': '2025-09-13', 'home_team': 'Pacific FC', 'away_team': 'Vancouver FC', 'home_goals': 3, 'away_goals': 0},
-        {'date': '2025-09-14', 'home_team': 'Cavalry FC', 'away_team': 'HFX Wanderers FC', 'home_goals': 1, 'away_goals': 0},
-        {'date': '2025-09-14', 'home_team': 'Atletico Ottawa', 'away_team': 'York United FC', 'home_goals': 1, 'away_goals': 2},
-        # Week 24
-        {'date': '2025-09-20', 'home_team': 'Valour FC', 'away_team': 'Pacific FC', 'home_goals': 0, 'away_goals': 1},
-        {'date': '2025-09-20', 'home_team': 'HFX Wanderers FC', 'away_team': 'Atletico Ottawa', 'home_goals': 2, 'away_goals': 1},
-        {'date': '2025-09-21', 'home_team': 'York United FC', 'away_team': 'Forge FC', 'home_goals': 1, 'away_goals': 1},
-        {'date': '2025-09-21', 'home_team': 'Vancouver FC', 'away_team': 'Cavalry FC', 'home_goals': 0, 'away_goals': 2},
-        # Week 25
-        {'date': '2025-09-27', 'home_team': 'Forge FC', 'away_team': 'HFX Wanderers FC', 'home_goals': 2, 'away_goals': 0},
-        {'date': '2025-09-27', 'home_team': 'Cavalry FC', 'away_team': 'Vancouver FC', 'home_goals': 2, 'away_goals': 1},
-        {'date': '2025-09-28', 'home_team': 'Pacific FC', 'away_team': 'York United FC', 'home_goals': 0, 'away_goals': 0},
-        {'date': '2025-09-28', 'home_team': 'Atletico Ottawa', 'away_team': 'Valour FC', 'home_goals': 2, 'away_goals': 1},
-        # Week 26
-        {'date': '2025-10-04', 'home_team': 'HFX Wanderers FC', 'away_team': 'Cavalry FC', 'home_goals': 0, 'away_goals': 1},
-        {'date': '2025-10-04', 'home_team': 'Valour FC', 'away_team': 'York United FC', 'home_goals': 1, 'away_goals': 0},
-        {'date': '2025-10-05', 'home_team': 'Vancouver FC', 'away_team': 'Atletico Ottawa', 'home_goals': 1, 'away_goals': 2},
-        {'date': '2025-10-05', 'home_team': 'Pacific FC', 'away_team': 'Forge FC', 'home_goals': 1, 'away_goals': 2},
-        # Week 27
-        {'date': '2025-10-11', 'home_team': 'Forge FC', 'away_team': 'Vancouver FC', 'home_goals': 3, 'away_goals': 0},
-        {'date': '2025-10-11', 'home_team': 'Cavalry FC', 'away_team': 'Atletico Ottawa', 'home_goals': 1, 'away_goals': 0},
-        {'date': '2025-10-12', 'home_team': 'York United FC', 'away_team': 'HFX Wanderers FC', 'home_goals': 2, 'away_goals': 1},
-        {'date': '2025-10-12', 'home_team': 'Valour FC', 'away_team': 'Pacific FC', 'home_goals': 1, 'away_goals': 2},
-        # Week 28 - Final Week
-        {'date': '2025-10-18', 'home_team': 'Atletico Ottawa', 'away_team': 'Forge FC', 'home_goals': 0, 'away_goals': 1},
-        {'date': '2025-10-18', 'home_team': 'Pacific FC', 'away_team': 'Valour FC', 'home_goals': 2, 'away_goals': 0},
-        {'date': '2025-10-19', 'home_team': 'HFX Wanderers FC', 'away_team': 'Vancouver FC', 'home_goals': 3, 'away_goals': 1},
-        {'date': '2025-10-19', 'home_team': 'York United FC', 'away_team': 'Cavalry FC', 'home_goals': 0, 'away_goals': 2},
-    ]
-
-    # Process and add venue information
-    def process_season(matches: List[Dict], season: int) -> pd.DataFrame:
-        for match in matches:
-            match['season'] = season
-            match['venue'] = STADIUMS.get(match['home_team'], 'Unknown')
-        return pd.DataFrame(matches)
+def _concat_seasons(frames: List[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Concatenate per-season frames in a single step.
 
-    return {
-        2025: process_season(season_2025, 2025),
-        2024: process_season(season_2024, 2024),
-        2023: process_season(season_2023, 2023),
-        2022: process_season(season_2022, 2022),
-        2021: process_season(season_2021, 2021),
-        2020: process_season(season_2020, 2020),
-        2019: process_season(season_2019, 2019),
-    }
+    Historical seasons carry categorical team/venue columns while the API
+    season has plain strings; mixed inputs make pd.concat fall back to object
+    columns, so every frame is first cast to one shared categorical dtype.
+    """
+    frames = list(frames)
+    for cols in (('home_team', 'away_team'), ('venue',)):
+        values = set()
+        for df in frames:
+            for col in cols:
+                if col in df.columns:
+                    values.update(df[col].dropna().unique())
+        dtype = pd.CategoricalDtype(sorted(values))
+        frames = [
+            df.astype({col: dtype for col in cols if col in df.columns})
+            for df in frames
+        ]
+
+    return pd.concat(frames, ignore_index=True)
 
 
 def build_full_dataset(data_dir: str = None):
@@ -1206,13 +1212,13 @@ def build_full_dataset(data_dir: str = None):
 
     for year, df in data.items():
         filepath = os.path.join(data_dir, f"cpl_{year}.csv")
-        df.to_csv(filepath, index=False)
+        df.to_csv(filepath, index=False, lineterminator='\n')
         logger.info(f"Saved {len(df)} matches to {filepath}")
 
     # Combine all seasons
-    all_matches = pd.concat(data.values(), ignore_index=True)
+    all_matches = get_all_seasons()
     all_filepath = os.path.join(data_dir, "cpl_all.csv")
-    all_matches.to_csv(all_filepath, index=False)
+    all_matches.to_csv(all_filepath, index=False, lineterminator='\n')
     logger.info(f"Saved combined dataset: {len(all_matches)} total matches")
 
     return all_matches
@@ -1223,9 +1229,11 @@ def fetch_from_canpl_api(year: int, data_dir: str) -> pd.DataFrame:
     Fetch data from the official CanPL SDP API (discovered via TASK 1.2A).
     This is the PRIMARY and most reliable data source for 2025+.
     """
-    try:
-        from canpl_api_client import CanPLAPIClient
+    if CanPLAPIClient is None:
+        logger.warning("canpl_api_client not found")
+        return pd.DataFrame()
 
+    try:
         client = CanPLAPIClient()
         season_id = client.get_season_id(year)
 
@@ -1240,19 +1248,21 @@ def fetch_from_canpl_api(year: int, data_dir: str) -> pd.DataFrame:
 
         if not df.empty:
             # Standardize columns for CSV export
-            export_cols = ['date', 'season', 'home_team', 'away_team',
-                           'home_goals', 'away_goals', 'venue', 'referee']
+            export_cols = ('date', 'season', 'home_team', 'away_team',
+                           'home_goals', 'away_goals', 'venue', 'referee')
             df_export = df[[col for col in export_cols if col in df.columns]].copy()
+            # Same datetime64 dtype as generate_historical_data so seasons concat cleanly
+            df_export['date'] = pd.to_datetime(df_export['date'], format='%Y-%m-%d', cache=True)
+            # Write date-sorted so CPLDataLoader can skip its sort on load
+            df_export = df_export.sort_values('date', kind='stable', ignore_index=True)
 
             # Save to CSV
             filepath = os.path.join(data_dir, f"cpl_{year}.csv")
-            df_export.to_csv(filepath, index=False)
+            df_export.to_csv(filepath, index=False, lineterminator='\n')
             logger.info(f"  ✓ Saved {len(df_export)} matches to {filepath}")
 
             return df_export
 
-    except ImportError:
-        logger.warning("canpl_api_client not found")
     except Exception as e:
         logger.error(f"API fetch failed: {e}")
 
@@ -1291,11 +1301,10 @@ if __name__ == "__main__":
         # For historical years (2019-2024) or if API fails, use stored historical data
         if df.empty:
             logger.info(f"Using historical data for {year}...")
-            historical = generate_historical_data()
-            if year in historical:
-                df = historical[year]
+            if year in _historical_seasons():
+                df = get_season(year)
                 filepath = os.path.join(data_dir, f"cpl_{year}.csv")
-                df.to_csv(filepath, index=False)
+                df.to_csv(filepath, index=False, lineterminator='\n')
                 logger.info(f"  ✓ Saved {len(df)} matches from historical data")
 
         if not df.empty:
@@ -1306,17 +1315,17 @@ if __name__ == "__main__":
 
     # Combine all years
     if all_data:
-        combined = pd.concat(all_data, ignore_index=True)
+        combined = _concat_seasons(all_data)
 
         # Ensure consistent columns
-        required_cols = ['date', 'season', 'home_team', 'away_team', 'home_goals', 'away_goals', 'venue', 'referee']
+        required_cols = ('date', 'season', 'home_team', 'away_team', 'home_goals', 'away_goals', 'venue', 'referee')
         for col in required_cols:
             if col not in combined.columns:
                 combined[col] = ''
 
         # Save combined file
         all_filepath = os.path.join(data_dir, "cpl_all.csv")
-        combined.to_csv(all_filepath, index=False)
+        combined.to_csv(all_filepath, index=False, lineterminator='\n')
 
         print(f"\n{'='*50}")
         print(f"✅ Dataset built: {len(combined)} total matches")
@@ -3,9 +3,10 @@ CPL Data Loader
 Helper functions for loading and working with CPL Analytics data.
 """
 
+import numpy as np
 import pandas as pd
 import os
-from typing import Optional, List, Union
+from typing import Optional, List, Union, Dict, Tuple, Iterator
 from pathlib import Path
 import logging
 
@@ -15,6 +16,15 @@ logger = logging.getLogger(__name__)
 # Default data directory
 DATA_DIR = Path(__file__).parent.parent / "data"
 
+# Narrow dtypes for match CSVs; nullable Int8 keeps unplayed fixtures as <NA>
+MATCH_DTYPES = {'home_goals': 'Int8', 'away_goals': 'Int8', 'season': 'int16'}
+
+# Form letters indexed by result + 1 (-1 loss, 0 draw, 1 win)
+FORM_CHARS = np.array(['L', 'D', 'W'])
+
+# Match CSVs always store ISO dates, so the parser can take its C fast path
+MATCH_CSV_OPTIONS = {'dtype': MATCH_DTYPES, 'parse_dates': ['date'], 'date_format': '%Y-%m-%d'}
+
 
 class CPLDataLoader:
     """Load and query CPL Analytics data."""
@@ -27,6 +37,41 @@ class CPLDataLoader:
             data_dir: Path to data directory. Defaults to ../data relative to this file.
         """
         self.data_dir = Path(data_dir) if data_dir else DATA_DIR
+        # Parsed CSVs keyed by (path, mtime_ns), so edited files are re-read
+        self._file_cache: Dict[Tuple[Path, int], pd.DataFrame] = {}
+        # Combined frames keyed by the exact set of files (and mtimes) they came from
+        self._combined_cache: Dict[tuple, pd.DataFrame] = {}
+        # Per-frame derived data (team row positions, team tables), keyed by
+        # id(frame); cached frames are never evicted, so their ids stay unique
+        self._team_indexes: Dict[int, tuple] = {}
+        self._team_tables: Dict[int, pd.DataFrame] = {}
+        self._home_results: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+
+    def _read_csv_cached(self, file: Path, **read_kwargs) -> pd.DataFrame:
+        """Parse a CSV once per modification time."""
+        key = (file, file.stat().st_mtime_ns)
+        if key not in self._file_cache:
+            self._file_cache[key] = pd.read_csv(file, **read_kwargs)
+            logger.info(f"Loaded {len(self._file_cache[key])} rows from {file.name}")
+        return self._file_cache[key]
+
+    @staticmethod
+    def _season_files(directory: Path, pattern: str,
+                      seasons: Optional[List[int]] = None) -> List[Path]:
+        """Files matching pattern whose name carries a season in `seasons`."""
+        files = []
+
+        for file in sorted(directory.glob(pattern)):
+            # Extract year from filename
+            try:
+                year = int(file.stem.split('_')[1])
+            except (IndexError, ValueError):
+                continue
+
+            if seasons is None or year in seasons:
+                files.append(file)
+
+        return files
 
     def load_matches(self, seasons: Optional[List[int]] = None) -> pd.DataFrame:
         """
@@ -39,33 +84,77 @@ class CPLDataLoader:
         Returns:
             DataFrame with all match data
         """
+        return self._load_matches(seasons).copy()
+
+    def _load_matches(self, seasons: Optional[List[int]] = None) -> pd.DataFrame:
+        """Cached load_matches; the returned frame is shared, so do not mutate it."""
         matches_dir = self.data_dir / "matches"
 
         if not matches_dir.exists():
             logger.warning(f"Matches directory not found: {matches_dir}")
             return pd.DataFrame()
 
-        dfs = []
+        files = self._season_files(matches_dir, "cpl_*.csv", seasons)
 
-        for file in matches_dir.glob("cpl_*.csv"):
-            # Extract year from filename
-            try:
-                year = int(file.stem.split('_')[1])
-            except (IndexError, ValueError):
-                continue
+        key = ('matches',) + tuple((file, file.stat().st_mtime_ns) for file in files)
+        if key in self._combined_cache:
+            return self._combined_cache[key]
 
-            if seasons is None or year in seasons:
-                df = pd.read_csv(file)
-                dfs.append(df)
-                logger.info(f"Loaded {len(df)} matches from {file.name}")
+        dfs = [
+            self._read_csv_cached(file, **MATCH_CSV_OPTIONS)
+            for file in files
+        ]
 
         if dfs:
             combined = pd.concat(dfs, ignore_index=True)
-            combined['date'] = pd.to_datetime(combined['date'])
-            return combined.sort_values('date').reset_index(drop=True)
+            # Few distinct teams/venues: store them as categorical codes
+            teams = pd.CategoricalDtype(sorted(
+                {*combined['home_team'].dropna(), *combined['away_team'].dropna()}
+            ))
+            combined[['home_team', 'away_team']] = (
+                combined[['home_team', 'away_team']].astype(teams)
+            )
+            if 'venue' in combined.columns:
+                combined['venue'] = combined['venue'].astype('category')
+            # Each season file is written date-sorted, so this is usually a no-op;
+            # otherwise a stable sort merges the already-sorted runs in linear time
+            if not combined['date'].is_monotonic_increasing:
+                combined = combined.sort_values('date', kind='stable')
+            combined = combined.reset_index(drop=True)
+            self._combined_cache[key] = combined
+            return combined
 
         return pd.DataFrame()
 
+    def iter_matches(self, seasons: Optional[List[int]] = None,
+                     team: Optional[str] = None) -> Iterator[pd.DataFrame]:
+        """
+        Stream match data one season file at a time.
+
+        Unlike load_matches, nothing is cached or combined, so peak memory is a
+        single file. Files for other seasons are skipped without being read.
+
+        Args:
+            seasons: Seasons to read (default: all)
+            team: Only yield matches involving this team
+
+        Yields:
+            DataFrame of matches per season file, dates parsed
+        """
+        matches_dir = self.data_dir / "matches"
+
+        if not matches_dir.exists():
+            logger.warning(f"Matches directory not found: {matches_dir}")
+            return
+
+        for file in self._season_files(matches_dir, "cpl_*.csv", seasons):
+            df = pd.read_csv(file, **MATCH_CSV_OPTIONS)
+
+            if team is not None:
+                df = df[(df['home_team'] == team) | (df['away_team'] == team)]
+
+            yield df
+
     def load_team_stats(self) -> pd.DataFrame:
         """Load team season statistics."""
         stats_file = self.data_dir / "team_stats" / "team_season_stats.csv"
@@ -91,29 +180,51 @@ class CPLDataLoader:
         if not odds_dir.exists():
             return pd.DataFrame()
 
-        dfs = []
+        files = self._season_files(odds_dir, "odds_*.csv", seasons)
 
-        for file in odds_dir.glob("odds_*.csv"):
-            try:
-                year = int(file.stem.split('_')[1])
-            except (IndexError, ValueError):
-                continue
+        key = ('odds',) + tuple((file, file.stat().st_mtime_ns) for file in files)
+        if key in self._combined_cache:
+            return self._combined_cache[key].copy()
 
-            if seasons is None or year in seasons:
-                df = pd.read_csv(file)
-                dfs.append(df)
+        dfs = [self._read_csv_cached(file) for file in files]
 
         if dfs:
             combined = pd.concat(dfs, ignore_index=True)
             if 'timestamp' in combined.columns:
                 combined['timestamp'] = pd.to_datetime(combined['timestamp'])
-            return combined
+            self._combined_cache[key] = combined
+            return combined.copy()
 
         return pd.DataFrame()
 
+    def _team_index(self, matches: pd.DataFrame) -> Tuple[Dict, Dict, Dict]:
+        """Home, away and combined team -> sorted row position maps for a cached frame."""
+        key = id(matches)
+        if key not in self._team_indexes:
+            home = matches.groupby('home_team', sort=False, observed=True).indices
+            away = matches.groupby('away_team', sort=False, observed=True).indices
+            empty = np.array([], dtype=np.intp)
+            both = {
+                team: np.union1d(home.get(team, empty), away.get(team, empty))
+                for team in home.keys() | away.keys()
+            }
+            self._team_indexes[key] = (home, away, both)
+        return self._team_indexes[key]
+
+    def _home_result(self, matches: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        """Per-row home result (1 win, 0 draw, -1 loss) and played mask for a cached frame."""
+        key = id(matches)
+        if key not in self._home_results:
+            diff = matches['home_goals'].astype('Int16') - matches['away_goals']
+            played = diff.notna().to_numpy()
+            result = np.sign(diff.fillna(0).to_numpy(dtype=np.int8))
+            self._home_results[key] = (result, played)
+        return self._home_results[key]
+
     def get_team_matches(self, team: str,
                          home_only: bool = False,
-                         away_only: bool = False) -> pd.DataFrame:
+                         away_only: bool = False,
+                         seasons: Optional[List[int]] = None) -> pd.DataFrame:
         """
         Get all matches for a specific team.
 
@@ -121,81 +232,125 @@ class CPLDataLoader:
             team: Team name
             home_only: Only return home matches
             away_only: Only return away matches
+            seasons: Only load these seasons (default: all)
 
         Returns:
             DataFrame of team's matches
         """
-        matches = self.load_matches()
+        matches = self._load_matches(seasons)
 
         if matches.empty:
             return matches
 
-        if home_only:
-            return matches[matches['home_team'] == team]
-        elif away_only:
-            return matches[matches['away_team'] == team]
-        else:
-            return matches[
-                (matches['home_team'] == team) |
-                (matches['away_team'] == team)
-            ]
-
-    def get_head_to_head(self, team1: str, team2: str) -> pd.DataFrame:
+        home, away, both = self._team_index(matches)
+        index = home if home_only else away if away_only else both
+
+        return matches.iloc[index.get(team, [])]
+
+    def get_head_to_head(self, team1: str, team2: str,
+                         seasons: Optional[List[int]] = None) -> pd.DataFrame:
         """
         Get head-to-head record between two teams.
 
         Args:
             team1: First team
             team2: Second team
+            seasons: Only load these seasons (default: all)
 
         Returns:
             DataFrame of matches between the teams
         """
-        matches = self.load_matches()
+        matches = self._load_matches(seasons)
 
         if matches.empty:
             return matches
 
-        h2h = matches[
-            ((matches['home_team'] == team1) & (matches['away_team'] == team2)) |
-            ((matches['home_team'] == team2) & (matches['away_team'] == team1))
-        ]
+        home, away, _ = self._team_index(matches)
+        empty = np.array([], dtype=np.intp)
+        positions = np.union1d(
+            np.intersect1d(home.get(team1, empty), away.get(team2, empty)),
+            np.intersect1d(home.get(team2, empty), away.get(team1, empty)),
+        )
+        h2h = matches.iloc[positions]
 
         return h2h.sort_values('date')
 
-    def get_recent_form(self, team: str, n_matches: int = 5) -> str:
+    def get_recent_form(self, team: str, n_matches: int = 5,
+                        seasons: Optional[List[int]] = None) -> str:
         """
         Get recent form string for a team (e.g., "WWDLW").
 
         Args:
             team: Team name
             n_matches: Number of recent matches to consider
+            seasons: Only load these seasons (default: all)
 
         Returns:
             Form string (W=Win, D=Draw, L=Loss)
         """
-        matches = self.get_team_matches(team).tail(n_matches)
+        matches = self._load_matches(seasons)
 
         if matches.empty:
             return ""
 
-        form = []
-        for _, match in matches.iterrows():
-            is_home = match['home_team'] == team
-            team_goals = match['home_goals'] if is_home else match['away_goals']
-            opp_goals = match['away_goals'] if is_home else match['home_goals']
+        home, _, both = self._team_index(matches)
+        rows = both.get(team, np.array([], dtype=np.intp))
+        rows = rows[max(len(rows) - n_matches, 0):]
 
-            if pd.isna(team_goals) or pd.isna(opp_goals):
-                continue
+        # Flip the precomputed home result for away matches; skip unplayed ones
+        result, played = self._home_result(matches)
+        team_result = np.where(np.isin(rows, home.get(team, [])), result[rows], -result[rows])
 
-            if team_goals > opp_goals:
-                form.append('W')
-            elif team_goals < opp_goals:
-                form.append('L')
-            else:
-                form.append('D')
+        return ''.join(FORM_CHARS[team_result[played[rows]] + 1])
+
+    def _team_table(self, matches: pd.DataFrame) -> pd.DataFrame:
+        """
+        Aggregate statistics for every team in one vectorized pass.
 
-        return ''.join(form)
+        Args:
+            matches: Match rows to aggregate
+
+        Returns:
+            DataFrame indexed by team with played/wins/draws/losses/goals/points
+        """
+        # One row per team per match, from that team's perspective
+        long = pd.concat([
+            pd.DataFrame({'team': matches['home_team'], 'gf': matches['home_goals'],
+                          'ga': matches['away_goals']}),
+            pd.DataFrame({'team': matches['away_team'], 'gf': matches['away_goals'],
+                          'ga': matches['home_goals']}),
+        ], ignore_index=True)
+        teams = long['team'].dropna().unique()
+
+        # Unplayed matches (missing score) don't count, but their teams still appear
+        long = long.dropna(subset=['gf', 'ga'])
+        table = long.assign(
+            wins=long['gf'] > long['ga'],
+            draws=long['gf'] == long['ga'],
+            losses=long['gf'] < long['ga'],
+        ).groupby('team', observed=True).agg(
+            wins=('wins', 'sum'),
+            draws=('draws', 'sum'),
+            losses=('losses', 'sum'),
+            goals_for=('gf', 'sum'),
+            goals_against=('ga', 'sum'),
+        ).reindex(teams, fill_value=0)
+
+        table['played'] = table['wins'] + table['draws'] + table['losses']
+        table['goal_difference'] = table['goals_for'] - table['goals_against']
+        table['points'] = table['wins'] * 3 + table['draws']
+        return table
+
+    def _season_table(self, season: Optional[int] = None) -> pd.DataFrame:
+        """Team table for a season (or all seasons), built once per loaded frame."""
+        matches = self._load_matches(seasons=[season] if season else None)
+        if matches.empty:
+            return pd.DataFrame()
+
+        key = id(matches)
+        if key not in self._team_tables:
+            self._team_tables[key] = self._team_table(matches)
+        return self._team_tables[key]
 
     def calculate_team_stats(self, team: str,
                              season: Optional[int] = None) -> dict:
@@ -209,55 +364,27 @@ class CPLDataLoader:
         Returns:
             Dictionary of statistics
         """
-        matches = self.load_matches(seasons=[season] if season else None)
-        team_matches = matches[
-            (matches['home_team'] == team) |
-            (matches['away_team'] == team)
-        ]
-
-        if team_matches.empty:
+        table = self._season_table(season)
+        if team not in table.index:
             return {}
 
-        # Calculate stats
-        wins = 0
-        draws = 0
-        losses = 0
-        goals_for = 0
-        goals_against = 0
-
-        for _, m in team_matches.iterrows():
-            is_home = m['home_team'] == team
-            gf = m['home_goals'] if is_home else m['away_goals']
-            ga = m['away_goals'] if is_home else m['home_goals']
-
-            if pd.isna(gf) or pd.isna(ga):
-                continue
-
-            goals_for += gf
-            goals_against += ga
-
-            if gf > ga:
-                wins += 1
-            elif gf < ga:
-                losses += 1
-            else:
-                draws += 1
-
-        played = wins + draws + losses
+        # Native Python scalars, so the dict stays JSON-serializable
+        row = dict(zip(table.columns, table.loc[team].tolist()))
+        played = row['played']
 
         return {
             'team': team,
             'season': season,
             'played': played,
-            'wins': wins,
-            'draws': draws,
-            'losses': losses,
-            'goals_for': goals_for,
-            'goals_against': goals_against,
-            'goal_difference': goals_for - goals_against,
-            'points': wins * 3 + draws,
-            'win_rate': wins / played if played > 0 else 0,
-            'ppg': (wins * 3 + draws) / played if played > 0 else 0,
+            'wins': row['wins'],
+            'draws': row['draws'],
+            'losses': row['losses'],
+            'goals_for': row['goals_for'],
+            'goals_against': row['goals_against'],
+            'goal_difference': row['goal_difference'],
+            'points': row['points'],
+            'win_rate': row['wins'] / played if played > 0 else 0,
+            'ppg': row['points'] / played if played > 0 else 0,
         }
 
     def get_standings(self, season: int) -> pd.DataFrame:
@@ -270,23 +397,12 @@ class CPLDataLoader:
         Returns:
             DataFrame with standings
         """
-        matches = self.load_matches(seasons=[season])
-
-        if matches.empty:
-            return pd.DataFrame()
-
-        teams = set(matches['home_team'].unique()) | set(matches['away_team'].unique())
-
-        standings = []
-        for team in teams:
-            stats = self.calculate_team_stats(team, season)
-            if stats:
-                standings.append(stats)
+        df = self._season_table(season)
 
-        if not standings:
+        if df.empty:
             return pd.DataFrame()
 
-        df = pd.DataFrame(standings)
+        df = df.rename_axis('team').reset_index()
         df = df.sort_values(
             ['points', 'goal_difference', 'goals_for'],
             ascending=[False, False, False]
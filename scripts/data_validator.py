@@ -3,6 +3,7 @@ CPL Data Validator
 Quality checks for CPL Analytics data.
 """
 
+import numpy as np
 import pandas as pd
 from typing import List, Tuple, Optional
 from dataclasses import dataclass
@@ -20,7 +21,7 @@ class CheckSeverity(Enum):
     INFO = "info"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ValidationResult:
     """Result of a single validation check."""
     check_name: str
@@ -44,9 +45,11 @@ VALID_TEAMS = [
     # Historical names
     'York9 FC',
 ]
+VALID_TEAMS_SET = frozenset(VALID_TEAMS)
 
 # CPL started in 2019
 FIRST_CPL_SEASON = 2019
+CPL_START = pd.Timestamp(f'{FIRST_CPL_SEASON}-01-01')
 
 
 class CPLDataValidator:
@@ -54,6 +57,11 @@ class CPLDataValidator:
 
     def __init__(self):
         self.results: List[ValidationResult] = []
+        # Parsed 'date' column shared by the date checks (or the parse error)
+        self._dates: Optional[pd.Series] = None
+        self._date_error: Optional[Exception] = None
+        # Column names of the frame being validated, for O(1) presence checks
+        self._columns: frozenset = frozenset()
 
     def validate_matches(self, df: pd.DataFrame) -> List[ValidationResult]:
         """
@@ -76,57 +84,95 @@ class CPLDataValidator:
             ))
             return self.results
 
-        # Run checks
-        self._check_required_fields(df)
-        self._check_team_names(df)
-        self._check_score_validity(df)
-        self._check_date_validity(df)
-        self._check_duplicates(df)
-        self._check_attendance(df)
-        self._check_season_consistency(df)
-        self._check_home_away_different(df)
+        self._columns = frozenset(df.columns)
+        self._parse_dates(df)
+
+        # Run checks; each returns its own results
+        checks = (
+            self._check_required_fields,
+            self._check_team_names,
+            self._check_score_validity,
+            self._check_date_validity,
+            self._check_duplicates,
+            self._check_attendance,
+            self._check_season_consistency,
+            self._check_home_away_different,
+        )
+        for check in checks:
+            self.results.extend(check(df))
 
         return self.results
 
-    def _check_required_fields(self, df: pd.DataFrame):
+    def _parse_dates(self, df: pd.DataFrame):
+        """Parse the date column once for all date-based checks."""
+        self._dates = None
+        self._date_error = None
+
+        if 'date' not in self._columns:
+            return
+
+        try:
+            # Stored dates are ISO; fall back to inference for anything else
+            self._dates = pd.to_datetime(df['date'], format='ISO8601')
+        except (ValueError, TypeError):
+            try:
+                self._dates = pd.to_datetime(df['date'])
+            except Exception as e:
+                self._date_error = e
+
+    def _check_required_fields(self, df: pd.DataFrame) -> List[ValidationResult]:
         """Check that required fields are present and non-null."""
+        results = []
+
         required = ['date', 'home_team', 'away_team', 'home_goals', 'away_goals']
 
         for col in required:
-            if col not in df.columns:
-                self.results.append(ValidationResult(
+            if col not in self._columns:
+                results.append(ValidationResult(
                     check_name=f"required_field_{col}",
                     passed=False,
                     severity=CheckSeverity.ERROR,
                     message=f"Missing required column: {col}"
                 ))
-            elif df[col].isna().any():
-                null_count = df[col].isna().sum()
-                self.results.append(ValidationResult(
+                continue
+
+            # One null mask per column; only the first 10 null labels are gathered
+            missing = df[col].isna().to_numpy()
+            if missing.any():
+                null_count = missing.sum()
+                results.append(ValidationResult(
                     check_name=f"null_check_{col}",
                     passed=False,
                     severity=CheckSeverity.ERROR,
                     message=f"Missing values in {col}: {null_count} rows",
-                    details=str(df[df[col].isna()].index.tolist()[:10])
+                    details=str(df.index[np.flatnonzero(missing)[:10]].tolist())
                 ))
             else:
-                self.results.append(ValidationResult(
+                results.append(ValidationResult(
                     check_name=f"required_field_{col}",
                     passed=True,
                     severity=CheckSeverity.INFO,
                     message=f"Column {col} present and complete"
                 ))
 
-    def _check_team_names(self, df: pd.DataFrame):
+        return results
+
+    def _check_team_names(self, df: pd.DataFrame) -> List[ValidationResult]:
         """Check that all team names are valid CPL teams."""
-        if 'home_team' not in df.columns or 'away_team' not in df.columns:
-            return
+        results = []
+
+        if 'home_team' not in self._columns or 'away_team' not in self._columns:
+            return results
 
-        all_teams = set(df['home_team'].unique()) | set(df['away_team'].unique())
-        invalid_teams = all_teams - set(VALID_TEAMS)
+        # One hash-based unique over both columns, then a small set diff
+        all_teams = set(pd.unique(np.concatenate([
+            df['home_team'].to_numpy(dtype=object),
+            df['away_team'].to_numpy(dtype=object),
+        ])))
+        invalid_teams = all_teams - VALID_TEAMS_SET
 
         if invalid_teams:
-            self.results.append(ValidationResult(
+            results.append(ValidationResult(
                 check_name="valid_team_names",
                 passed=False,
                 severity=CheckSeverity.ERROR,
@@ -134,22 +180,33 @@ class CPLDataValidator:
                 details=f"Valid teams: {VALID_TEAMS}"
             ))
         else:
-            self.results.append(ValidationResult(
+            results.append(ValidationResult(
                 check_name="valid_team_names",
                 passed=True,
                 severity=CheckSeverity.INFO,
                 message=f"All {len(all_teams)} team names are valid"
             ))
 
-    def _check_score_validity(self, df: pd.DataFrame):
+        return results
+
+    def _check_score_validity(self, df: pd.DataFrame) -> List[ValidationResult]:
         """Check that scores are valid (non-negative, reasonable range)."""
-        if 'home_goals' not in df.columns or 'away_goals' not in df.columns:
-            return
+        results = []
+
+        if 'home_goals' not in self._columns or 'away_goals' not in self._columns:
+            return results
+
+        # Both score columns as one 2-D float block (missing -> NaN, never flagged)
+        goals = df[['home_goals', 'away_goals']].to_numpy(dtype=float, na_value=np.nan)
+
+        # Scalar bounds first; row masks are only built for failing checks
+        has_negative = np.fmin.reduce(goals, axis=None) < 0
+        has_high = np.fmax.reduce(goals, axis=None) > 10
 
         # Check for negative scores
-        negative = (df['home_goals'] < 0) | (df['away_goals'] < 0)
-        if negative.any():
-            self.results.append(ValidationResult(
+        if has_negative:
+            negative = (goals < 0).any(axis=1)
+            results.append(ValidationResult(
                 check_name="negative_scores",
                 passed=False,
                 severity=CheckSeverity.ERROR,
@@ -157,9 +214,9 @@ class CPLDataValidator:
             ))
 
         # Check for suspiciously high scores
-        high = (df['home_goals'] > 10) | (df['away_goals'] > 10)
-        if high.any():
-            self.results.append(ValidationResult(
+        if has_high:
+            high = (goals > 10).any(axis=1)
+            results.append(ValidationResult(
                 check_name="high_scores",
                 passed=False,
                 severity=CheckSeverity.WARNING,
@@ -168,26 +225,36 @@ class CPLDataValidator:
                                       'home_goals', 'away_goals']].to_dict('records'))
             ))
 
-        if not negative.any() and not high.any():
-            self.results.append(ValidationResult(
+        if not has_negative and not has_high:
+            results.append(ValidationResult(
                 check_name="score_validity",
                 passed=True,
                 severity=CheckSeverity.INFO,
                 message="All scores are within valid range"
             ))
 
-    def _check_date_validity(self, df: pd.DataFrame):
+        return results
+
+    def _check_date_validity(self, df: pd.DataFrame) -> List[ValidationResult]:
         """Check that dates are valid and within CPL era."""
-        if 'date' not in df.columns:
-            return
+        results = []
+
+        if 'date' not in self._columns:
+            return results
 
         try:
-            dates = pd.to_datetime(df['date'])
+            if self._date_error is not None:
+                raise self._date_error
+            dates = self._dates
+            now = pd.Timestamp.now()
+            first_date, last_date = dates.min(), dates.max()
+            too_early_any = first_date < CPL_START
+            future_any = last_date > now
 
             # Check for dates before CPL existed
-            too_early = dates < f'{FIRST_CPL_SEASON}-01-01'
-            if too_early.any():
-                self.results.append(ValidationResult(
+            if too_early_any:
+                too_early = dates < CPL_START
+                results.append(ValidationResult(
                     check_name="dates_before_cpl",
                     passed=False,
                     severity=CheckSeverity.ERROR,
@@ -195,43 +262,48 @@ class CPLDataValidator:
                 ))
 
             # Check for future dates
-            future = dates > pd.Timestamp.now()
-            if future.any():
-                self.results.append(ValidationResult(
+            if future_any:
+                future = dates > now
+                results.append(ValidationResult(
                     check_name="future_dates",
                     passed=False,
                     severity=CheckSeverity.WARNING,
                     message=f"Future dates found: {future.sum()} matches"
                 ))
 
-            if not too_early.any() and not future.any():
-                self.results.append(ValidationResult(
+            if not too_early_any and not future_any:
+                results.append(ValidationResult(
                     check_name="date_validity",
                     passed=True,
                     severity=CheckSeverity.INFO,
-                    message=f"All dates valid (range: {dates.min()} to {dates.max()})"
+                    message=f"All dates valid (range: {first_date} to {last_date})"
                 ))
 
         except Exception as e:
-            self.results.append(ValidationResult(
+            results.append(ValidationResult(
                 check_name="date_parsing",
                 passed=False,
                 severity=CheckSeverity.ERROR,
                 message=f"Error parsing dates: {e}"
             ))
 
-    def _check_duplicates(self, df: pd.DataFrame):
+        return results
+
+    def _check_duplicates(self, df: pd.DataFrame) -> List[ValidationResult]:
         """Check for duplicate matches."""
+        results = []
+
         key_cols = ['date', 'home_team', 'away_team']
 
-        if not all(col in df.columns for col in key_cols):
-            return
+        if not self._columns.issuperset(key_cols):
+            return results
 
-        duplicates = df.duplicated(subset=key_cols, keep=False)
+        # One uint64 hash per row, then a single-column duplicate scan
+        duplicates = pd.util.hash_pandas_object(df[key_cols], index=False).duplicated(keep=False)
 
         if duplicates.any():
             dup_count = duplicates.sum()
-            self.results.append(ValidationResult(
+            results.append(ValidationResult(
                 check_name="duplicates",
                 passed=False,
                 severity=CheckSeverity.WARNING,
@@ -239,33 +311,39 @@ class CPLDataValidator:
                 details=str(df[duplicates][key_cols].head(10).to_dict('records'))
             ))
         else:
-            self.results.append(ValidationResult(
+            results.append(ValidationResult(
                 check_name="duplicates",
                 passed=True,
                 severity=CheckSeverity.INFO,
                 message="No duplicate matches found"
             ))
 
-    def _check_attendance(self, df: pd.DataFrame):
+        return results
+
+    def _check_attendance(self, df: pd.DataFrame) -> List[ValidationResult]:
         """Check attendance figures are reasonable."""
-        if 'attendance' not in df.columns:
-            return
+        results = []
+
+        if 'attendance' not in self._columns:
+            return results
 
         attendance = df['attendance'].dropna()
 
         if len(attendance) == 0:
-            self.results.append(ValidationResult(
+            results.append(ValidationResult(
                 check_name="attendance_data",
                 passed=True,
                 severity=CheckSeverity.INFO,
                 message="No attendance data to validate"
             ))
-            return
+            return results
+
+        lowest, highest = attendance.min(), attendance.max()
 
         # Check for negative attendance
-        negative = attendance < 0
-        if negative.any():
-            self.results.append(ValidationResult(
+        if lowest < 0:
+            negative = attendance < 0
+            results.append(ValidationResult(
                 check_name="negative_attendance",
                 passed=False,
                 severity=CheckSeverity.ERROR,
@@ -273,43 +351,49 @@ class CPLDataValidator:
             ))
 
         # Check for suspiciously high attendance (CPL stadiums max ~25k)
-        high = attendance > 30000
-        if high.any():
-            self.results.append(ValidationResult(
+        if highest > 30000:
+            high = attendance > 30000
+            results.append(ValidationResult(
                 check_name="high_attendance",
                 passed=False,
                 severity=CheckSeverity.WARNING,
                 message=f"Unusually high attendance (>30k): {high.sum()} matches"
             ))
 
-        if not negative.any() and not high.any():
-            self.results.append(ValidationResult(
+        if lowest >= 0 and highest <= 30000:
+            results.append(ValidationResult(
                 check_name="attendance_validity",
                 passed=True,
                 severity=CheckSeverity.INFO,
-                message=f"Attendance range: {int(attendance.min())}-{int(attendance.max())}"
+                message=f"Attendance range: {int(lowest)}-{int(highest)}"
             ))
 
-    def _check_season_consistency(self, df: pd.DataFrame):
+        return results
+
+    def _check_season_consistency(self, df: pd.DataFrame) -> List[ValidationResult]:
         """Check that season field matches date year."""
-        if 'season' not in df.columns or 'date' not in df.columns:
-            return
+        results = []
+
+        if 'season' not in self._columns or 'date' not in self._columns:
+            return results
+
+        if self._dates is None:
+            return results
 
         try:
-            dates = pd.to_datetime(df['date'])
-            years = dates.dt.year
+            years = self._dates.dt.year
 
             # CPL season typically spans Apr-Oct of same year
             mismatched = df['season'] != years
             if mismatched.any():
-                self.results.append(ValidationResult(
+                results.append(ValidationResult(
                     check_name="season_date_mismatch",
                     passed=False,
                     severity=CheckSeverity.WARNING,
                     message=f"Season doesn't match date year: {mismatched.sum()} matches"
                 ))
             else:
-                self.results.append(ValidationResult(
+                results.append(ValidationResult(
                     check_name="season_consistency",
                     passed=True,
                     severity=CheckSeverity.INFO,
@@ -318,27 +402,33 @@ class CPLDataValidator:
         except Exception:
             pass
 
-    def _check_home_away_different(self, df: pd.DataFrame):
+        return results
+
+    def _check_home_away_different(self, df: pd.DataFrame) -> List[ValidationResult]:
         """Check that home and away teams are different."""
-        if 'home_team' not in df.columns or 'away_team' not in df.columns:
-            return
+        results = []
+
+        if 'home_team' not in self._columns or 'away_team' not in self._columns:
+            return results
 
         same = df['home_team'] == df['away_team']
         if same.any():
-            self.results.append(ValidationResult(
+            results.append(ValidationResult(
                 check_name="home_away_same",
                 passed=False,
                 severity=CheckSeverity.ERROR,
                 message=f"Home and away team same: {same.sum()} matches"
             ))
         else:
-            self.results.append(ValidationResult(
+            results.append(ValidationResult(
                 check_name="home_away_different",
                 passed=True,
                 severity=CheckSeverity.INFO,
                 message="All matches have different home/away teams"
             ))
 
+        return results
+
     def print_report(self):
         """Print validation report to console."""
         print("\n" + "=" * 60)
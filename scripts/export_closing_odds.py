@@ -44,6 +44,20 @@ def export_closing_odds_to_public(private_db_path: str, public_csv_path: str, se
 
     # Connect to private database
     conn = sqlite3.connect(private_db_path)
+    conn.execute("PRAGMA mmap_size=268435456")
+    conn.execute("PRAGMA cache_size=-65536")
+
+    # Index the export's filter and sort columns so it is a range scan, not a
+    # full table scan. Idempotent; skipped for schemas without is_closing or
+    # read-only databases.
+    try:
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_odds_export "
+            "ON odds_history(season, is_closing, date, match_id, bookmaker)"
+        )
+        conn.commit()
+    except sqlite3.Error:
+        pass
 
     # Get last week's matches (only export after matches complete)
     last_week = datetime.now() - timedelta(days=7)
@@ -67,6 +81,10 @@ def export_closing_odds_to_public(private_db_path: str, public_csv_path: str, se
     WHERE season = ?
       AND date >= ?
       AND is_closing = 1
+      -- Decimal odds below 1.0 are impossible; keep them out of the public file
+      AND (closing_home_odds IS NULL OR closing_home_odds >= 1.0)
+      AND (closing_draw_odds IS NULL OR closing_draw_odds >= 1.0)
+      AND (closing_away_odds IS NULL OR closing_away_odds >= 1.0)
     ORDER BY date, match_id, bookmaker
     """
 
@@ -93,6 +111,9 @@ def export_closing_odds_to_public(private_db_path: str, public_csv_path: str, se
         FROM odds_history
         WHERE season = ?
           AND date >= ?
+          AND (home_odds IS NULL OR home_odds >= 1.0)
+          AND (draw_odds IS NULL OR draw_odds >= 1.0)
+          AND (away_odds IS NULL OR away_odds >= 1.0)
         ORDER BY date, match_id, bookmaker
         """
         df = pd.read_sql_query(alt_query, conn, params=(season, last_week.date().isoformat()))
@@ -112,11 +133,10 @@ def export_closing_odds_to_public(private_db_path: str, public_csv_path: str, se
         try:
             existing = pd.read_csv(public_csv_path)
             if not existing.empty:
-                # Append new data, remove duplicates
-                df = pd.concat([existing, df], ignore_index=True).drop_duplicates(
-                    subset=['match_id', 'bookmaker'],
-                    keep='last'
-                )
+                # Append new data, remove duplicates (one uint64 hash per (match, bookmaker))
+                merged = pd.concat([existing, df], ignore_index=True)
+                key = pd.util.hash_pandas_object(merged[['match_id', 'bookmaker']], index=False)
+                df = merged[~key.duplicated(keep='last')]
                 # Sort by date and match
                 df = df.sort_values(['date', 'match_id', 'bookmaker'])
         except Exception as e:
@@ -150,6 +170,29 @@ def generate_match_id(home_team: str, away_team: str, date: str) -> str:
     return f"{home_clean}_vs_{away_clean}_{date_clean}"
 
 
+def generate_match_ids(home_team: pd.Series, away_team: pd.Series, date: pd.Series) -> pd.Series:
+    """
+    Vectorized generate_match_id for whole columns.
+
+    Args:
+        home_team: Home team names
+        away_team: Away team names
+        date: Match dates (YYYY-MM-DD strings or datetimes)
+
+    Returns:
+        Series of match IDs in format: home_vs_away_YYYYMMDD
+    """
+    def clean(teams: pd.Series) -> pd.Series:
+        return (teams.str.lower()
+                .str.replace(' fc', '', regex=False)
+                .str.replace(' ', '_', regex=False)
+                .str.strip())
+
+    date_clean = date.astype(str).str.replace('-', '', regex=False)
+
+    return clean(home_team) + '_vs_' + clean(away_team) + '_' + date_clean
+
+
 def validate_odds(df: pd.DataFrame) -> bool:
     """
     Validate odds data before export.
@@ -6,16 +6,42 @@ Outputs a CSV with one row per finished match, containing the main referee.
 """
 
 import argparse
+import asyncio
 import csv
+import json
 import logging
+import os
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 
 from canpl_api_client import CanPLAPIClient
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Matchfacts requests in flight at once
+MAX_CONCURRENT_FETCHES = 8
+
+# Referees of finished matches, keyed by match ID; finished matches don't
+# change, so re-runs only fetch matches not seen before. Matches whose
+# officials aren't published yet are not cached, so they are retried
+DEFAULT_FACTS_CACHE = "data/matches/.canpl_matchfacts.json"
+
+# Output CSV header; rows are written as tuples in this order
+OUTPUT_COLUMNS = (
+    "season",
+    "match_id",
+    "date",
+    "home_team",
+    "away_team",
+    "referee_id",
+    "referee_name",
+    "referee_short_name",
+)
+
+# Rows handed to csv.writer.writerows at a time
+WRITE_CHUNK_SIZE = 256
+
 
 def _parse_date(match_date_utc: Optional[str]) -> str:
     if not match_date_utc:
@@ -29,25 +55,71 @@ def _extract_main_referee(match_facts: Dict) -> Dict[str, str]:
     Empty strings if not found.
     """
     referees = match_facts.get("referees") or []
+
+    # First official listed for each role, in one pass
+    by_role: Dict[str, Dict] = {}
     for ref in referees:
         if not isinstance(ref, dict):
             continue
-        role_label = str(ref.get("roleLabel") or ref.get("role") or "").strip()
-        if role_label.lower() == "referee":
-            first = (ref.get("mediaFirstName") or "").strip()
-            last = (ref.get("mediaLastName") or "").strip()
-            name = " ".join([p for p in [first, last] if p]).strip()
-            return {
-                "referee_id": ref.get("refereeId", "") or "",
-                "referee_name": name,
-                "referee_short_name": ref.get("shortName", "") or "",
-            }
+        role_label = str(ref.get("roleLabel") or ref.get("role") or "").strip().lower()
+        by_role.setdefault(role_label, ref)
+
+    ref = by_role.get("referee")
+    if ref:
+        first = (ref.get("mediaFirstName") or "").strip()
+        last = (ref.get("mediaLastName") or "").strip()
+        name = " ".join([p for p in [first, last] if p]).strip()
+        return {
+            "referee_id": ref.get("refereeId", "") or "",
+            "referee_name": name,
+            "referee_short_name": ref.get("shortName", "") or "",
+        }
     return {"referee_id": "", "referee_name": "", "referee_short_name": ""}
 
 
-def extract_referees(start_year: int, end_year: int, output_path: str, limit: Optional[int] = None) -> None:
+async def _fetch_facts(client: CanPLAPIClient, semaphore: asyncio.Semaphore,
+                       season_id: str, match_id: str) -> Optional[Dict]:
+    """Fetch one match's facts on a worker thread; None if the request fails."""
+    async with semaphore:
+        try:
+            return await asyncio.to_thread(client.get_match_facts, season_id, match_id)
+        except Exception as exc:
+            logger.warning("Matchfacts failed for %s: %s", match_id, exc)
+            return None
+
+
+async def _fetch_all_facts(client: CanPLAPIClient,
+                           targets: List[Tuple[str, str]]) -> List[Optional[Dict]]:
+    """Fetch facts for (season_id, match_id) pairs concurrently, in input order."""
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+    return await asyncio.gather(
+        *(_fetch_facts(client, semaphore, season_id, match_id) for season_id, match_id in targets)
+    )
+
+
+def _load_facts_cache(path: Optional[str]) -> Dict[str, Dict]:
+    if not path or not os.path.exists(path):
+        return {}
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError) as exc:
+        logger.warning("Ignoring unreadable matchfacts cache %s: %s", path, exc)
+        return {}
+
+
+def _save_facts_cache(path: Optional[str], cache: Dict[str, Dict]) -> None:
+    if not path:
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(cache, f)
+
+
+def extract_referees(start_year: int, end_year: int, output_path: str, limit: Optional[int] = None,
+                     cache_path: Optional[str] = DEFAULT_FACTS_CACHE) -> None:
     client = CanPLAPIClient()
-    rows = []
+    cache = _load_facts_cache(cache_path)
+    pending = []
 
     for year in range(start_year, end_year + 1):
         season_id = client.get_season_id(year)
@@ -64,47 +136,66 @@ def extract_referees(start_year: int, end_year: int, output_path: str, limit: Op
 
         logger.info("  %s finished matches", len(finished))
 
-        for match in finished:
-            match_id = match.get("matchId")
-            if not match_id:
-                continue
+        pending.extend(
+            (year, season_id, match) for match in finished if match.get("matchId")
+        )
+
+    # The facts calls are latency-bound, so fetch every season's matches in one
+    # concurrent batch; the client is blocking, so each call runs on a thread.
+    # Entries without officials are refetched: they may just not be published yet
+    missing = [(season_id, match["matchId"]) for _, season_id, match in pending
+               if not cache.get(match["matchId"], {}).get("referees")]
+    logger.info("Fetching matchfacts for %s matches (%s cached)...",
+                len(missing), len(pending) - len(missing))
+
+    # This run's facts: the cache plus everything fetched, with or without officials
+    facts_by_match = dict(cache)
+    if missing:
+        fetched = asyncio.run(_fetch_all_facts(client, missing))
+        for (_, match_id), facts in zip(missing, fetched):
+            if facts is not None:
+                # Only the officials are used, so only they are kept
+                facts_by_match[match_id] = {"referees": facts.get("referees") or []}
+                if facts_by_match[match_id]["referees"]:
+                    cache[match_id] = facts_by_match[match_id]
+                else:
+                    cache.pop(match_id, None)
+        _save_facts_cache(cache_path, cache)
+
+    # Rows go to the file in bounded chunks as they're built; the facts are
+    # already fetched, so there is nothing left to wait on between writes
+    written = 0
+    chunk = []
+    with open(output_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(OUTPUT_COLUMNS)
 
-            try:
-                facts = client.get_match_facts(season_id, match_id)
-            except Exception as exc:
-                logger.warning("Matchfacts failed for %s: %s", match_id, exc)
+        for year, _, match in pending:
+            facts = facts_by_match.get(match["matchId"])
+            if facts is None:
                 continue
 
             ref = _extract_main_referee(facts)
 
-            rows.append({
-                "season": year,
-                "match_id": match_id,
-                "date": _parse_date(match.get("matchDateUtc")),
-                "home_team": match.get("home", {}).get("officialName", ""),
-                "away_team": match.get("away", {}).get("officialName", ""),
-                "referee_id": ref["referee_id"],
-                "referee_name": ref["referee_name"],
-                "referee_short_name": ref["referee_short_name"],
-            })
-
-    logger.info("Writing %s rows to %s", len(rows), output_path)
-    with open(output_path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(
-            f,
-            fieldnames=[
-                "season",
-                "match_id",
-                "date",
-                "home_team",
-                "away_team",
-                "referee_id",
-                "referee_name",
-                "referee_short_name",
-            ],
-        )
-        writer.writeheader()
-        writer.writerows(rows)
+            chunk.append((
+                year,
+                match["matchId"],
+                _parse_date(match.get("matchDateUtc")),
+                match.get("home", {}).get("officialName", ""),
+                match.get("away", {}).get("officialName", ""),
+                ref["referee_id"],
+                ref["referee_name"],
+                ref["referee_short_name"],
+            ))
+            if len(chunk) == WRITE_CHUNK_SIZE:
+                writer.writerows(chunk)
+                written += len(chunk)
+                chunk.clear()
+
+        writer.writerows(chunk)
+        written += len(chunk)
+
+    logger.info("Wrote %s rows to %s", written, output_path)
 
 
 def main() -> None:
@@ -117,12 +208,17 @@ def main() -> None:
         help="Output CSV path",
     )
     parser.add_argument("--limit", type=int, default=None, help="Limit matches per season")
+    parser.add_argument(
+        "--cache",
+        default=DEFAULT_FACTS_CACHE,
+        help="Matchfacts cache path (empty string to disable)",
+    )
     args = parser.parse_args()
 
     if args.start_year > args.end_year:
         raise SystemExit("start-year must be <= end-year")
 
-    extract_referees(args.start_year, args.end_year, args.output, args.limit)
+    extract_referees(args.start_year, args.end_year, args.output, args.limit, args.cache or None)
 
 
 if __name__ == "__main__":
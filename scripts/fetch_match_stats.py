@@ -14,13 +14,14 @@ Options:
     --seasons 2019 2024 2025   fetch only specific seasons
     --resume                   skip matches already in output CSVs
     --teamstats-only           skip header fetch (faster)
-    --delay 0.3                seconds between requests (default 0.25)
+    --delay 0.3                seconds between requests per worker (default 0.25)
+    --workers 4                concurrent requests (default 4)
 """
 
 import argparse
+import asyncio
 import csv
 import json
-import time
 import urllib.request
 import urllib.error
 from pathlib import Path
@@ -100,6 +101,19 @@ def fetch_json(url: str) -> dict | None:
         return None
 
 
+async def fetch_all_json(urls: list[str], workers: int, delay: float) -> list[dict | None]:
+    """Fetch URLs concurrently, `workers` at a time, each pausing `delay` after its request."""
+    semaphore = asyncio.Semaphore(workers)
+
+    async def fetch(url: str) -> dict | None:
+        async with semaphore:
+            data = await asyncio.to_thread(fetch_json, url)
+            await asyncio.sleep(delay)
+            return data
+
+    return await asyncio.gather(*(fetch(url) for url in urls))
+
+
 def parse_teamstats(data: dict) -> tuple[dict, dict]:
     """Returns (home_stats, away_stats) dicts keyed by csv column name."""
     home, away = {}, {}
@@ -181,9 +195,14 @@ def main():
     parser.add_argument("--teamstats-only", action="store_true",
                         help="Skip header fetch")
     parser.add_argument("--delay", type=float, default=0.25,
-                        help="Seconds between API requests (default 0.25)")
+                        help="Seconds between API requests per worker (default 0.25)")
+    parser.add_argument("--workers", type=int, default=4,
+                        help="Concurrent API requests (default 4)")
     args = parser.parse_args()
 
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+
     target_seasons = {y: sid for y, sid in SEASONS.items()
                       if args.seasons is None or y in args.seasons}
 
@@ -224,6 +243,17 @@ def main():
             matches = [m for m in data.get("matches", []) if m.get("status") == "FINISHED"]
             print(f"  {len(matches)} finished matches")
 
+            # Fetch every per-match page for the season concurrently up front;
+            # rows are still written below in match order
+            urls = []
+            for m in matches:
+                mid = m["matchId"]
+                if mid not in existing_ts:
+                    urls.append(f"{BASE_URL}/seasons/{sid}/match/{mid}/teamstats?locale=en-US")
+                if hd_writer and mid not in existing_hd:
+                    urls.append(f"{BASE_URL}/seasons/{sid}/matches/{mid}/header?locale=en-US")
+            fetched = dict(zip(urls, asyncio.run(fetch_all_json(urls, args.workers, args.delay))))
+
             for i, m in enumerate(matches, 1):
                 mid = m["matchId"]
                 date = (m.get("matchDateLocal") or "")[:10]
@@ -240,10 +270,7 @@ def main():
 
                 # Teamstats
                 if mid not in existing_ts:
-                    ts_data = fetch_json(
-                        f"{BASE_URL}/seasons/{sid}/match/{mid}/teamstats?locale=en-US"
-                    )
-                    time.sleep(args.delay)
+                    ts_data = fetched[f"{BASE_URL}/seasons/{sid}/match/{mid}/teamstats?locale=en-US"]
 
                     if ts_data:
                         home_stats, away_stats = parse_teamstats(ts_data)
@@ -270,10 +297,7 @@ def main():
 
                 # Header (attendance + scorers)
                 if hd_writer and mid not in existing_hd:
-                    hd_data = fetch_json(
-                        f"{BASE_URL}/seasons/{sid}/matches/{mid}/header?locale=en-US"
-                    )
-                    time.sleep(args.delay)
+                    hd_data = fetched[f"{BASE_URL}/seasons/{sid}/matches/{mid}/header?locale=en-US"]
                     if hd_data:
                         hd_row = {**base_row, **parse_header(hd_data)}
                         hd_writer.writerow(hd_row)
@@ -1,13 +1,21 @@
 """
 Load CPL CSV data into PostgreSQL database.
+
+get_connection() is a context manager that borrows a pooled connection:
+use `with get_connection() as conn:`. It no longer returns a connection
+for the caller to close.
 """
 
 import pandas as pd
-import psycopg2
+from psycopg2 import sql
 from psycopg2.extras import execute_values
+from psycopg2.pool import ThreadedConnectionPool
+from contextlib import contextmanager
+import io
 import os
 import logging
 from pathlib import Path
+from typing import List, Optional
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -34,63 +42,172 @@ TEAM_IDS = {
 }
 
 
-def get_connection():
-    """Get database connection."""
-    return psycopg2.connect(**DB_CONFIG)
+# Columns written to the matches table, in COPY order
+MATCH_COLUMNS = ['season', 'date', 'home_team_id', 'away_team_id',
+                 'home_goals', 'away_goals', 'venue']
 
 
-def load_matches(data_dir: str):
-    """Load match data from CSVs into PostgreSQL."""
-    conn = get_connection()
-    cur = conn.cursor()
+# Shared by every get_connection() caller; created on first use so importing
+# this module doesn't open a connection
+_POOL: Optional[ThreadedConnectionPool] = None
 
-    matches_dir = Path(data_dir) / "matches"
-
-    # Clear existing match data
-    cur.execute("DELETE FROM match_stats")
-    cur.execute("DELETE FROM contextual_data")
-    cur.execute("DELETE FROM historical_odds")
-    cur.execute("DELETE FROM lineups")
-    cur.execute("DELETE FROM matches")
-    conn.commit()
 
+@contextmanager
+def get_connection():
+    """
+    Borrow a database connection from the module's connection pool.
+
+    The connection is returned to the pool on exit; any transaction still
+    open at that point is rolled back by the pool.
+
+    Yields:
+        psycopg2 connection
+    """
+    global _POOL
+    if _POOL is None:
+        _POOL = ThreadedConnectionPool(1, 8, **DB_CONFIG)
+
+    conn = _POOL.getconn()
+    try:
+        yield conn
+    finally:
+        _POOL.putconn(conn)
+
+
+def prepare_match_rows(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Map team names to IDs and select the matches table columns.
+
+    Rows with an unknown team are logged and dropped.
+
+    Args:
+        df: Match rows as read from a season CSV
+
+    Returns:
+        DataFrame with MATCH_COLUMNS, goals as nullable integers
+    """
+    rows = pd.DataFrame({
+        'season': df['season'],
+        'date': df['date'],
+        'home_team_id': df['home_team'].map(TEAM_IDS),
+        'away_team_id': df['away_team'].map(TEAM_IDS),
+        'home_goals': df['home_goals'],
+        'away_goals': df['away_goals'],
+        'venue': df['venue'] if 'venue' in df.columns else None,
+    })
+
+    unknown = rows['home_team_id'].isna() | rows['away_team_id'].isna()
+    for home, away in zip(df.loc[unknown, 'home_team'], df.loc[unknown, 'away_team']):
+        logger.warning(f"Unknown team: {home} or {away}")
+
+    # Nullable ints so COPY sees "2", not "2.0", and NULL for unplayed matches
+    return rows[~unknown].astype({
+        'home_team_id': 'int64',
+        'away_team_id': 'int64',
+        'home_goals': 'Int64',
+        'away_goals': 'Int64',
+    })
+
+
+def drop_secondary_indexes(cur, table: str) -> List[str]:
+    """
+    Drop a table's indexes that don't back a constraint (PK/unique).
+
+    Bulk loads then build each index once at the end instead of updating it
+    row by row. Run inside the load's transaction so a failure restores them.
+
+    Args:
+        cur: Open cursor
+        table: Table name in the current schema
+
+    Returns:
+        CREATE INDEX statements to recreate the dropped indexes
+    """
+    cur.execute("""
+        SELECT indexname, indexdef
+        FROM pg_indexes
+        WHERE schemaname = current_schema()
+          AND tablename = %s
+          AND indexname NOT IN (
+              SELECT conname FROM pg_constraint WHERE conrelid = %s::regclass
+          )
+    """, (table, table))
+    indexes = cur.fetchall()
+
+    for name, _ in indexes:
+        cur.execute(sql.SQL("DROP INDEX {}").format(sql.Identifier(name)))
+
+    return [definition for _, definition in indexes]
+
+
+def load_matches(data_dir: str, use_copy: bool = True):
+    """
+    Load match data from CSVs into PostgreSQL.
+
+    Args:
+        data_dir: Data directory containing matches/
+        use_copy: Stream each file with COPY (fastest). Set False to fall back
+            to batched multi-row INSERTs, e.g. where COPY is not permitted.
+    """
+    matches_dir = Path(data_dir) / "matches"
     total_loaded = 0
 
-    for csv_file in sorted(matches_dir.glob("cpl_*.csv")):
-        if 'sample' in csv_file.name or 'all' in csv_file.name:
-            continue
-
-        logger.info(f"Loading {csv_file.name}...")
-        df = pd.read_csv(csv_file)
-
-        for _, row in df.iterrows():
-            home_team_id = TEAM_IDS.get(row['home_team'])
-            away_team_id = TEAM_IDS.get(row['away_team'])
-
-            if not home_team_id or not away_team_id:
-                logger.warning(f"Unknown team: {row['home_team']} or {row['away_team']}")
-                continue
-
-            cur.execute("""
-                INSERT INTO matches (
-                    season, date, home_team_id, away_team_id,
-                    home_goals, away_goals, venue
-                ) VALUES (%s, %s, %s, %s, %s, %s, %s)
-            """, (
-                row['season'],
-                row['date'],
-                home_team_id,
-                away_team_id,
-                row['home_goals'],
-                row['away_goals'],
-                row.get('venue', None)
-            ))
-            total_loaded += 1
-
-        conn.commit()
-
-    cur.close()
-    conn.close()
+    with get_connection() as conn:
+        cur = conn.cursor()
+
+        # One transaction for the whole reload: a failure leaves the old data intact,
+        # and there is a single commit instead of one per file
+        try:
+            # The data is fully reloadable from the CSVs, so skip waiting on the WAL flush
+            cur.execute("SET LOCAL synchronous_commit = off")
+
+            # Clear existing match data
+            cur.execute("DELETE FROM match_stats")
+            cur.execute("DELETE FROM contextual_data")
+            cur.execute("DELETE FROM historical_odds")
+            cur.execute("DELETE FROM lineups")
+            cur.execute("DELETE FROM matches")
+
+            # Rebuilt after the load, once, rather than maintained per row
+            index_definitions = drop_secondary_indexes(cur, 'matches')
+
+            for csv_file in sorted(matches_dir.glob("cpl_*.csv")):
+                if 'sample' in csv_file.name or 'all' in csv_file.name:
+                    continue
+
+                logger.info(f"Loading {csv_file.name}...")
+                rows = prepare_match_rows(pd.read_csv(csv_file))
+
+                if use_copy:
+                    # Stream the whole file in one COPY instead of one INSERT per row
+                    buf = io.StringIO()
+                    rows.to_csv(buf, index=False, header=False, na_rep='\\N')
+                    buf.seek(0)
+                    cur.copy_expert(
+                        f"COPY matches ({', '.join(MATCH_COLUMNS)}) "
+                        "FROM STDIN WITH (FORMAT csv, NULL '\\N')",
+                        buf
+                    )
+                else:
+                    # Python scalars with None for missing values, sent as multi-row INSERTs
+                    values = rows.astype(object).where(rows.notna(), None)
+                    execute_values(
+                        cur,
+                        f"INSERT INTO matches ({', '.join(MATCH_COLUMNS)}) VALUES %s",
+                        list(values.itertuples(index=False, name=None)),
+                        page_size=1000
+                    )
+                total_loaded += len(rows)
+
+            for definition in index_definitions:
+                cur.execute(definition)
+
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            cur.close()
 
     logger.info(f"Loaded {total_loaded} matches into PostgreSQL")
     return total_loaded
@@ -98,36 +215,35 @@ def load_matches(data_dir: str):
 
 def verify_data():
     """Verify data was loaded correctly."""
-    conn = get_connection()
-    cur = conn.cursor()
-
-    # Count matches
-    cur.execute("SELECT COUNT(*) FROM matches")
-    match_count = cur.fetchone()[0]
-
-    # Count by season
-    cur.execute("""
-        SELECT season, COUNT(*) as matches
-        FROM matches
-        GROUP BY season
-        ORDER BY season
-    """)
-    seasons = cur.fetchall()
-
-    # Get sample match with team names
-    cur.execute("""
-        SELECT m.date, ht.name as home_team, at.name as away_team,
-               m.home_goals, m.away_goals
-        FROM matches m
-        JOIN teams ht ON m.home_team_id = ht.id
-        JOIN teams at ON m.away_team_id = at.id
-        ORDER BY m.date DESC
-        LIMIT 5
-    """)
-    recent = cur.fetchall()
-
-    cur.close()
-    conn.close()
+    with get_connection() as conn:
+        cur = conn.cursor()
+        try:
+            # Count matches
+            cur.execute("SELECT COUNT(*) FROM matches")
+            match_count = cur.fetchone()[0]
+
+            # Count by season
+            cur.execute("""
+                SELECT season, COUNT(*) as matches
+                FROM matches
+                GROUP BY season
+                ORDER BY season
+            """)
+            seasons = cur.fetchall()
+
+            # Get sample match with team names
+            cur.execute("""
+                SELECT m.date, ht.name as home_team, at.name as away_team,
+                       m.home_goals, m.away_goals
+                FROM matches m
+                JOIN teams ht ON m.home_team_id = ht.id
+                JOIN teams at ON m.away_team_id = at.id
+                ORDER BY m.date DESC
+                LIMIT 5
+            """)
+            recent = cur.fetchall()
+        finally:
+            cur.close()
 
     print(f"\n{'='*50}")
     print("DATABASE VERIFICATION")
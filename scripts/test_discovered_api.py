@@ -9,10 +9,34 @@ Usage: python scripts/test_discovered_api.py
 """
 
 import requests
+import asyncio
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
+
+try:
+    import httpx  # Optional: multiplex every probe over one HTTP/2 connection
+except ImportError:
+    httpx = None
+
+try:
+    import orjson  # Optional: faster JSON decoding/encoding of endpoint payloads
+except ImportError:
+    orjson = None
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'application/json, text/plain, */*',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Referer': 'https://canpl.ca/',
+    'Origin': 'https://canpl.ca'
+}
+
+# Probes in flight at once; nearly all target canpl.ca, so this is also the
+# per-host limit
+MAX_WORKERS = 8
 
 
 def load_discovered_endpoints() -> Optional[Dict[str, Any]]:
@@ -29,17 +53,8 @@ def load_discovered_endpoints() -> Optional[Dict[str, Any]]:
         return json.load(f)
 
 
-def test_endpoint(url: str, method: str = 'GET') -> Dict[str, Any]:
-    """Test calling an endpoint directly."""
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-        'Accept': 'application/json, text/plain, */*',
-        'Accept-Language': 'en-US,en;q=0.9',
-        'Referer': 'https://canpl.ca/',
-        'Origin': 'https://canpl.ca'
-    }
-
-    result = {
+def _new_result(url: str, method: str) -> Dict[str, Any]:
+    return {
         'url': url,
         'method': method,
         'success': False,
@@ -49,25 +64,39 @@ def test_endpoint(url: str, method: str = 'GET') -> Dict[str, Any]:
         'error': None
     }
 
+
+def _record_response(result: Dict[str, Any], response) -> Dict[str, Any]:
+    """Fill in a result from a requests or httpx response."""
+    result['status_code'] = response.status_code
+    result['content_type'] = response.headers.get('Content-Type', '')
+
+    if response.status_code == 200:
+        result['success'] = True
+
+        # Try to parse as JSON (orjson.JSONDecodeError subclasses the stdlib one)
+        try:
+            result['data'] = orjson.loads(response.content) if orjson else response.json()
+        except json.JSONDecodeError:
+            result['data'] = response.text[:500]
+
+    return result
+
+
+def test_endpoint(url: str, method: str = 'GET',
+                  session: Optional[requests.Session] = None) -> Dict[str, Any]:
+    """Test calling an endpoint directly, over `session` if given."""
+    http = session or requests
+    result = _new_result(url, method)
+
     try:
         if method.upper() == 'GET':
-            response = requests.get(url, headers=headers, timeout=15)
+            response = http.get(url, headers=HEADERS, timeout=15)
         elif method.upper() == 'POST':
-            response = requests.post(url, headers=headers, timeout=15)
+            response = http.post(url, headers=HEADERS, timeout=15)
         else:
-            response = requests.request(method, url, headers=headers, timeout=15)
-
-        result['status_code'] = response.status_code
-        result['content_type'] = response.headers.get('Content-Type', '')
+            response = http.request(method, url, headers=HEADERS, timeout=15)
 
-        if response.status_code == 200:
-            result['success'] = True
-
-            # Try to parse as JSON
-            try:
-                result['data'] = response.json()
-            except json.JSONDecodeError:
-                result['data'] = response.text[:500]
+        _record_response(result, response)
 
     except requests.RequestException as e:
         result['error'] = str(e)
@@ -75,6 +104,66 @@ def test_endpoint(url: str, method: str = 'GET') -> Dict[str, Any]:
     return result
 
 
+async def _atest_endpoints(requests_to_try: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+    """Send every probe concurrently as streams on shared HTTP/2 connections."""
+    async with httpx.AsyncClient(
+        http2=True,
+        headers=HEADERS,
+        timeout=15,
+        limits=httpx.Limits(max_connections=MAX_WORKERS),
+    ) as client:
+
+        async def probe(url: str, method: str) -> Dict[str, Any]:
+            result = _new_result(url, method)
+            try:
+                _record_response(result, await client.request(method.upper(), url))
+            except Exception as e:
+                # Any per-probe failure (transport, bad URL, undecodable body)
+                # is recorded on that probe; the rest still run
+                result['error'] = str(e)
+            return result
+
+        return await asyncio.gather(*(probe(url, method) for url, method in requests_to_try))
+
+
+def test_endpoints(requests_to_try: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+    """
+    Test (url, method) pairs concurrently.
+
+    Uses one multiplexed HTTP/2 client when httpx (with h2) is installed,
+    otherwise a thread pool over one pooled requests session.
+
+    Args:
+        requests_to_try: (url, method) pairs
+
+    Returns:
+        test_endpoint results, in input order
+    """
+    if httpx is not None:
+        try:
+            return asyncio.run(_atest_endpoints(requests_to_try))
+        except (ImportError, RuntimeError) as e:
+            # ImportError: h2 not installed; RuntimeError: already inside an event loop
+            print(f"  (HTTP/2 unavailable, using threads: {e})")
+
+    with requests.Session() as session, ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        return list(executor.map(
+            lambda pair: test_endpoint(pair[0], pair[1], session), requests_to_try
+        ))
+
+
+def _json_prefix(data: Any, limit: int, **kwargs) -> str:
+    """First `limit` characters of json.dumps(data, **kwargs), without encoding the rest."""
+    chunks = []
+    size = 0
+    for chunk in json.JSONEncoder(**kwargs).iterencode(data):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size >= limit:
+            break
+    return ''.join(chunks)[:limit]
+
+
 def analyze_endpoint_data(data: Any) -> Dict[str, Any]:
     """Analyze the structure of endpoint data."""
     analysis = {
@@ -95,8 +184,8 @@ def analyze_endpoint_data(data: Any) -> Dict[str, Any]:
         analysis['sample_keys'] = list(data.keys())[:10]
         analysis['item_count'] = len(data)
 
-        # Check for common patterns
-        data_str = json.dumps(data).lower()
+        # Check for common patterns; the only full serialization of the payload
+        data_str = (orjson.dumps(data).decode() if orjson else json.dumps(data)).lower()
         analysis['contains_matches'] = any(
             k in data_str for k in ['match', 'fixture', 'game', 'score']
         )
@@ -130,14 +219,13 @@ def test_discovered_endpoints():
 
     useful_endpoints = []
 
-    for i, endpoint in enumerate(endpoints, 1):
-        url = endpoint.get('url', '')
-        method = endpoint.get('method', 'GET')
+    # Probe everything concurrently, then report in the original order
+    probes = [(endpoint.get('url', ''), endpoint.get('method', 'GET')) for endpoint in endpoints]
+    results = test_endpoints(probes)
 
+    for i, ((url, method), result) in enumerate(zip(probes, results), 1):
         print(f"\n[{i}/{len(endpoints)}] Testing: {method} {url[:80]}...")
 
-        result = test_endpoint(url, method)
-
         if result['success']:
             print(f"  ✅ SUCCESS! Status: {result['status_code']}")
             print(f"  Content-Type: {result['content_type']}")
@@ -165,11 +253,11 @@ def test_discovered_endpoints():
                         'url': url,
                         'method': method,
                         'analysis': analysis,
-                        'data_sample': json.dumps(result['data'])[:500]
+                        'data_sample': _json_prefix(result['data'], 500)
                     })
 
                 # Show sample data
-                sample = json.dumps(result['data'], indent=2)[:300]
+                sample = _json_prefix(result['data'], 300, indent=2)
                 print(f"  Sample: {sample}...")
 
         else:
@@ -238,9 +326,10 @@ def try_common_api_patterns():
 
     found = []
 
-    for url in common_patterns:
+    results = test_endpoints([(url, 'GET') for url in common_patterns])
+
+    for url, result in zip(common_patterns, results):
         print(f"\n  Testing: {url}")
-        result = test_endpoint(url)
 
         if result['success'] and result['data']:
             print(f"  ✅ FOUND! Status: {result['status_code']}")
@@ -4,19 +4,77 @@ Fetches weather data for CPL matches using OpenWeatherMap API.
 """
 
 import requests
-import pandas as pd
-from datetime import datetime, timedelta
-from typing import Optional, Dict, Tuple
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import numpy as np
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any, Optional, Dict, List, Tuple
+import asyncio
+import bisect
+import csv
 import logging
 import os
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
+if TYPE_CHECKING:
+    # Imported where used: the distance table and CLI don't need pandas
+    import pandas as pd
+
+try:
+    import httpx  # Optional: HTTP/2 prefetch of stadium forecasts
+except ImportError:
+    httpx = None
+
+try:
+    import orjson  # Optional: faster JSON decoding of API responses
+except ImportError:
+    orjson = None
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Weather requests in flight at once during enrichment
+MAX_CONCURRENT_REQUESTS = 8
+
+# Seconds a fetched 5-day forecast is reused for the same coordinates
+FORECAST_TTL = 1800
+
+# Failures that cost one lookup its weather rather than aborting a batch:
+# transport errors and malformed payloads (bad JSON, missing, null or
+# empty fields)
+LOOKUP_ERRORS = (requests.RequestException, ValueError, KeyError,
+                 IndexError, TypeError, AttributeError)
+
+# 16-point compass, and its point for each whole degree (the API reports
+# wind direction in whole degrees)
+CARDINAL_DIRECTIONS = ('N', 'NNE', 'NE', 'ENE', 'E', 'ESE', 'SE', 'SSE',
+                       'S', 'SSW', 'SW', 'WSW', 'W', 'WNW', 'NW', 'NNW')
+_CARDINAL_BY_DEGREE = tuple(CARDINAL_DIRECTIONS[round(d / 22.5) % 16] for d in range(360))
+
+# Columns added by enrich_matches_with_weather -> WeatherData attribute
+WEATHER_COLUMNS = {
+    'weather_temp_c': 'temperature_c',
+    'weather_feels_like_c': 'feels_like_c',
+    'weather_humidity': 'humidity',
+    'weather_wind_kmh': 'wind_speed_kmh',
+    'weather_wind_dir': 'wind_direction',
+    'weather_conditions': 'conditions',
+    'weather_precipitation_mm': 'precipitation_mm',
+}
+WEATHER_TEXT_COLUMNS = {'weather_wind_dir', 'weather_conditions'}
+
+
+def _json(response) -> Any:
+    """Decode a requests or httpx JSON response body, with orjson when it is installed."""
+    if orjson is None:
+        return response.json()
+    return orjson.loads(response.content)
 
-@dataclass
+
+@dataclass(slots=True)
 class WeatherData:
     """Weather conditions for a match."""
     temperature_c: float
@@ -31,64 +89,41 @@ class WeatherData:
     pressure_hpa: int
 
 
+@dataclass(slots=True, frozen=True)
+class Stadium:
+    """A team's home stadium."""
+    name: str
+    city: str
+    lat: float
+    lon: float
+
+    def __post_init__(self):
+        # Checked once, at import, so a typo can't reach the API or distance table
+        if not (-90 <= self.lat <= 90 and -180 <= self.lon <= 180):
+            raise ValueError(f"Invalid coordinates for {self.name}: ({self.lat}, {self.lon})")
+
+
 # CPL Stadium Coordinates
 CPL_STADIUMS = {
-    'Forge FC': {
-        'name': 'Tim Hortons Field',
-        'city': 'Hamilton',
-        'lat': 43.2557,
-        'lon': -79.8711
-    },
-    'Cavalry FC': {
-        'name': 'ATCO Field',
-        'city': 'Calgary',
-        'lat': 50.9977,
-        'lon': -114.0672
-    },
-    'Pacific FC': {
-        'name': 'Starlight Stadium',
-        'city': 'Langford',
-        'lat': 48.4494,
-        'lon': -123.4879
-    },
-    'York United FC': {
-        'name': 'York Lions Stadium',
-        'city': 'Toronto',
-        'lat': 43.7735,
-        'lon': -79.4980
-    },
-    'Valour FC': {
-        'name': 'IG Field',
-        'city': 'Winnipeg',
-        'lat': 49.8076,
-        'lon': -97.1443
-    },
-    'HFX Wanderers FC': {
-        'name': 'Wanderers Grounds',
-        'city': 'Halifax',
-        'lat': 44.6488,
-        'lon': -63.5752
-    },
-    'FC Edmonton': {
-        'name': 'Clarke Stadium',
-        'city': 'Edmonton',
-        'lat': 53.5720,
-        'lon': -113.4564
-    },
-    'Vancouver FC': {
-        'name': 'Willoughby Community Park',
-        'city': 'Langley',
-        'lat': 49.0171,
-        'lon': -122.6593
-    },
-    'Atletico Ottawa': {
-        'name': 'TD Place Stadium',
-        'city': 'Ottawa',
-        'lat': 45.3989,
-        'lon': -75.6831
-    }
+    'Forge FC': Stadium('Tim Hortons Field', 'Hamilton', 43.2557, -79.8711),
+    'Cavalry FC': Stadium('ATCO Field', 'Calgary', 50.9977, -114.0672),
+    'Pacific FC': Stadium('Starlight Stadium', 'Langford', 48.4494, -123.4879),
+    'York United FC': Stadium('York Lions Stadium', 'Toronto', 43.7735, -79.4980),
+    'Valour FC': Stadium('IG Field', 'Winnipeg', 49.8076, -97.1443),
+    'HFX Wanderers FC': Stadium('Wanderers Grounds', 'Halifax', 44.6488, -63.5752),
+    'FC Edmonton': Stadium('Clarke Stadium', 'Edmonton', 53.5720, -113.4564),
+    'Vancouver FC': Stadium('Willoughby Community Park', 'Langley', 49.0171, -122.6593),
+    'Atletico Ottawa': Stadium('TD Place Stadium', 'Ottawa', 45.3989, -75.6831)
 }
 
+# The stadium coordinates as parallel arrays, built once: hot paths index
+# by row instead of going through the Stadium objects
+_TEAMS = tuple(CPL_STADIUMS)
+_TEAM_INDEX = {team: i for i, team in enumerate(_TEAMS)}
+_LATS = np.array([CPL_STADIUMS[team].lat for team in _TEAMS], dtype=np.float64)
+_LONS = np.array([CPL_STADIUMS[team].lon for team in _TEAMS], dtype=np.float64)
+_COORDS = tuple(zip(_LATS.tolist(), _LONS.tolist()))
+
 
 class WeatherService:
     """Service for fetching weather data from OpenWeatherMap."""
@@ -107,6 +142,35 @@ class WeatherService:
         if not self.api_key:
             logger.warning("No OpenWeatherMap API key provided. Set OPENWEATHER_API_KEY env var.")
 
+        # One keep-alive connection pool for every call; key and units go on
+        # each request as default params
+        self.session = requests.Session()
+        self.session.params = {'appid': self.api_key, 'units': 'metric'}
+        # Transient failures (rate limits, 5xx, dropped connections) are retried
+        # here with backoff, honouring Retry-After, before any caller sees them
+        retry = Retry(
+            total=5,
+            backoff_factor=0.25,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset(['GET']),
+            respect_retry_after_header=True,
+        )
+        self.session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry))
+
+        # (lat, lon) rounded to ~100 m -> (monotonic fetch time, forecast items,
+        # their 'dt' timestamps)
+        self._forecasts: Dict[Tuple[float, float], Tuple[float, List[dict], List[int]]] = {}
+
+    def close(self):
+        """Close the underlying HTTP session."""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
     def get_current_weather(self, lat: float, lon: float) -> Optional[WeatherData]:
         """Get current weather for coordinates."""
         if not self.api_key:
@@ -114,20 +178,15 @@ class WeatherService:
 
         try:
             url = f"{self.BASE_URL}/weather"
-            params = {
-                'lat': lat,
-                'lon': lon,
-                'appid': self.api_key,
-                'units': 'metric'
-            }
-
-            response = requests.get(url, params=params, timeout=10)
+            params = {'lat': lat, 'lon': lon}
+
+            response = self.session.get(url, params=params, timeout=10)
             response.raise_for_status()
-            data = response.json()
+            data = _json(response)
 
             return self._parse_weather_response(data)
 
-        except Exception as e:
+        except LOOKUP_ERRORS as e:
             logger.error(f"Error fetching weather: {e}")
             return None
 
@@ -147,97 +206,143 @@ class WeatherService:
             return None
 
         try:
-            url = f"{self.BASE_URL}/forecast"
-            params = {
-                'lat': lat,
-                'lon': lon,
-                'appid': self.api_key,
-                'units': 'metric'
-            }
-
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            data = response.json()
+            items, times = self._get_forecast_entry(lat, lon)
+            if not items:
+                return None
 
-            # Find forecast closest to target date
-            best_forecast = None
-            min_diff = float('inf')
+            # Find forecast closest to target date: the items are in time
+            # order, so only the two either side of it can be closest
+            target_ts = target_date.timestamp()
+            i = bisect.bisect_left(times, target_ts)
+            candidates = [j for j in (i - 1, i) if 0 <= j < len(times)]
+            best = min(candidates, key=lambda j: abs(times[j] - target_ts))
 
-            for item in data.get('list', []):
-                forecast_time = datetime.fromtimestamp(item['dt'])
-                diff = abs((forecast_time - target_date).total_seconds())
+            return self._parse_forecast_item(items[best])
 
-                if diff < min_diff:
-                    min_diff = diff
-                    best_forecast = item
+        except LOOKUP_ERRORS as e:
+            logger.error(f"Error fetching forecast: {e}")
+            return None
 
-            if best_forecast:
-                return self._parse_forecast_item(best_forecast)
+    def get_full_forecast(self, lat: float, lon: float) -> List[dict]:
+        """
+        Get the raw 3-hourly forecast items for coordinates.
 
-            return None
+        One response covers every target date in the next 5 days, so it is
+        reused for FORECAST_TTL seconds instead of refetched per match.
 
-        except Exception as e:
-            logger.error(f"Error fetching forecast: {e}")
-            return None
+        Args:
+            lat: Latitude
+            lon: Longitude
 
-    def _parse_weather_response(self, data: dict) -> WeatherData:
-        """Parse current weather API response."""
-        main = data.get('main', {})
-        wind = data.get('wind', {})
-        weather = data.get('weather', [{}])[0]
+        Returns:
+            Forecast items in time order, as returned by the API
 
-        # Convert wind direction from degrees to cardinal
-        wind_deg = wind.get('deg', 0)
-        wind_dir = self._degrees_to_cardinal(wind_deg)
+        Raises:
+            requests.RequestException: If the request fails
+        """
+        return self._get_forecast_entry(lat, lon)[0]
 
-        # Get rain/snow if present
-        rain = data.get('rain', {}).get('1h', 0)
-        snow = data.get('snow', {}).get('1h', 0)
+    def _get_forecast_entry(self, lat: float, lon: float) -> Tuple[List[dict], List[int]]:
+        """Cached forecast items for coordinates and their sorted 'dt' timestamps."""
+        cached = self._forecasts.get((round(lat, 3), round(lon, 3)))
+        if cached and time.monotonic() - cached[0] < FORECAST_TTL:
+            return cached[1], cached[2]
 
-        return WeatherData(
-            temperature_c=main.get('temp', 0),
-            feels_like_c=main.get('feels_like', 0),
-            humidity=main.get('humidity', 0),
-            wind_speed_kmh=wind.get('speed', 0) * 3.6,  # m/s to km/h
-            wind_direction=wind_dir,
-            conditions=weather.get('main', 'Unknown'),
-            description=weather.get('description', ''),
-            precipitation_mm=rain + snow,
-            visibility_km=data.get('visibility', 10000) / 1000,
-            pressure_hpa=main.get('pressure', 0)
-        )
+        url = f"{self.BASE_URL}/forecast"
+        params = {'lat': lat, 'lon': lon}
+
+        response = self.session.get(url, params=params, timeout=10)
+        response.raise_for_status()
+        return self._store_forecast(lat, lon, _json(response).get('list', []))
+
+    def _store_forecast(self, lat: float, lon: float,
+                        items: List[dict]) -> Tuple[List[dict], List[int]]:
+        times = [item['dt'] for item in items]
+        self._forecasts[(round(lat, 3), round(lon, 3))] = (time.monotonic(), items, times)
+        return items, times
+
+    async def prefetch_forecasts(self, coords: List[Tuple[float, float]]) -> None:
+        """
+        Fetch forecasts for several locations into the cache concurrently,
+        as streams over one HTTP/2 connection.
+
+        Does nothing without httpx (and h2); locations that fail here are
+        left for get_full_forecast to fetch, with retries, over the session.
+
+        Args:
+            coords: (lat, lon) pairs
+        """
+        if httpx is None or not coords:
+            return
+
+        url = f"{self.BASE_URL}/forecast"
+        try:
+            async with httpx.AsyncClient(http2=True, params=self.session.params, timeout=10) as client:
+                responses = await asyncio.gather(
+                    *(client.get(url, params={'lat': lat, 'lon': lon}) for lat, lon in coords),
+                    return_exceptions=True,
+                )
+        except ImportError as e:
+            # h2 not installed
+            logger.debug(f"HTTP/2 forecast prefetch unavailable: {e}")
+            return
+
+        for (lat, lon), response in zip(coords, responses):
+            if isinstance(response, httpx.Response) and response.status_code == 200:
+                try:
+                    self._store_forecast(lat, lon, _json(response).get('list', []))
+                except LOOKUP_ERRORS as e:
+                    logger.debug(f"Bad forecast payload for ({lat}, {lon}): {e}")
+
+    def _parse_weather_response(self, data: dict) -> WeatherData:
+        """Parse current weather API response."""
+        return self._parse_item(data, '1h')
 
     def _parse_forecast_item(self, item: dict) -> WeatherData:
         """Parse a single forecast item."""
-        main = item.get('main', {})
-        wind = item.get('wind', {})
-        weather = item.get('weather', [{}])[0]
+        return self._parse_item(item, '3h')
+
+    def _parse_item(self, data: dict, precip_key: str) -> WeatherData:
+        """
+        Parse a current-weather response or forecast item; both share a shape.
 
+        Args:
+            data: Decoded weather object
+            precip_key: Rain/snow accumulation period, '1h' (current) or '3h' (forecast)
+        """
+        # Missing, null or empty sections fall back to the defaults below
+        main = data.get('main') or {}
+        wind = data.get('wind') or {}
+        weather = (data.get('weather') or [{}])[0]
+
+        # Convert wind direction from degrees to cardinal
         wind_deg = wind.get('deg', 0)
         wind_dir = self._degrees_to_cardinal(wind_deg)
 
-        rain = item.get('rain', {}).get('3h', 0)
-        snow = item.get('snow', {}).get('3h', 0)
+        # Get rain/snow if present
+        rain = (data.get('rain') or {}).get(precip_key, 0)
+        snow = (data.get('snow') or {}).get(precip_key, 0)
 
         return WeatherData(
             temperature_c=main.get('temp', 0),
             feels_like_c=main.get('feels_like', 0),
             humidity=main.get('humidity', 0),
-            wind_speed_kmh=wind.get('speed', 0) * 3.6,
+            wind_speed_kmh=wind.get('speed', 0) * 3.6,  # m/s to km/h
             wind_direction=wind_dir,
             conditions=weather.get('main', 'Unknown'),
             description=weather.get('description', ''),
             precipitation_mm=rain + snow,
-            visibility_km=item.get('visibility', 10000) / 1000,
+            visibility_km=data.get('visibility', 10000) / 1000,
             pressure_hpa=main.get('pressure', 0)
         )
 
     def _degrees_to_cardinal(self, degrees: float) -> str:
         """Convert wind direction from degrees to cardinal direction."""
-        directions = ['N', 'NNE', 'NE', 'ENE', 'E', 'ESE', 'SE', 'SSE',
-                      'S', 'SSW', 'SW', 'WSW', 'W', 'WNW', 'NW', 'NNW']
-        idx = round(degrees / 22.5) % 16
-        return directions[idx]
+        try:
+            return _CARDINAL_BY_DEGREE[degrees]
+        except (IndexError, TypeError):
+            # Fractional or out-of-range degrees
+            return CARDINAL_DIRECTIONS[round(degrees / 22.5) % 16]
 
 
 class CPLWeatherTracker:
@@ -248,19 +353,20 @@ class CPLWeatherTracker:
 
     def get_stadium_coords(self, home_team: str) -> Optional[Tuple[float, float]]:
         """Get coordinates for a team's home stadium."""
-        stadium = CPL_STADIUMS.get(home_team)
-        if stadium:
-            return (stadium['lat'], stadium['lon'])
-        return None
+        i = _TEAM_INDEX.get(home_team)
+        return _COORDS[i] if i is not None else None
 
-    def get_match_weather(self, home_team: str,
-                          match_datetime: datetime) -> Optional[WeatherData]:
+    def get_match_weather(self, home_team: str, match_datetime: datetime,
+                          now: Optional[datetime] = None) -> Optional[WeatherData]:
         """
         Get weather for a CPL match.
 
         Args:
             home_team: Name of home team
-            match_datetime: Date and time of match
+            match_datetime: Date and time of match; naive means local time
+            now: Current time, timezone-aware; defaults to the clock. Pass
+                 one value for a whole batch so every match is judged
+                 against the same instant.
 
         Returns:
             WeatherData or None if unavailable
@@ -272,15 +378,28 @@ class CPLWeatherTracker:
 
         lat, lon = coords
 
-        # Use current weather if match is within 3 hours
-        now = datetime.now()
-        if abs((match_datetime - now).total_seconds()) < 3 * 3600:
-            return self.weather_service.get_current_weather(lat, lon)
+        # Use forecast for future matches, current weather if within 3 hours
+        if self._uses_forecast(match_datetime, now):
+            return self.weather_service.get_forecast(lat, lon, match_datetime)
+
+        return self.weather_service.get_current_weather(lat, lon)
+
+    def _uses_forecast(self, match_datetime: datetime, now: Optional[datetime] = None) -> bool:
+        """Whether a match is more than 3 hours from now."""
+        # Compare as POSIX timestamps, so naive (local) kickoffs and an aware
+        # now line up, including across DST changes
+        now = now or datetime.now(timezone.utc)
+        return abs(match_datetime.timestamp() - now.timestamp()) >= 3 * 3600
 
-        # Use forecast for future matches
-        return self.weather_service.get_forecast(lat, lon, match_datetime)
+    def _prefetch_forecast(self, lat: float, lon: float) -> None:
+        """Fetch a stadium's forecast into the service's cache."""
+        try:
+            self.weather_service.get_full_forecast(lat, lon)
+        except LOOKUP_ERRORS as e:
+            # get_forecast retries and logs the failure for each match
+            logger.debug(f"Forecast prefetch failed for ({lat}, {lon}): {e}")
 
-    def enrich_matches_with_weather(self, matches_df: pd.DataFrame) -> pd.DataFrame:
+    def enrich_matches_with_weather(self, matches_df: 'pd.DataFrame') -> 'pd.DataFrame':
         """
         Add weather data to a DataFrame of matches.
 
@@ -290,47 +409,78 @@ class CPLWeatherTracker:
         Returns:
             DataFrame with weather columns added
         """
-        weather_data = []
-
-        for _, row in matches_df.iterrows():
-            home_team = row['home_team']
-
-            # Parse date/time
-            if 'kickoff_time' in row and pd.notna(row['kickoff_time']):
-                match_dt = datetime.strptime(
-                    f"{row['date']} {row['kickoff_time']}",
-                    '%Y-%m-%d %H:%M'
-                )
-            else:
-                # Default to 7 PM local time
-                match_dt = datetime.strptime(row['date'], '%Y-%m-%d').replace(hour=19)
+        import pandas as pd
+
+        # Parse every kickoff in one vectorized pass; default to 7 PM local time
+        if 'kickoff_time' in matches_df.columns:
+            times = matches_df['kickoff_time'].fillna('19:00').astype(str)
+        else:
+            times = '19:00'
+        kickoffs = pd.to_datetime(
+            matches_df['date'].astype(str) + ' ' + times,
+            format='%Y-%m-%d %H:%M'
+        )
 
-            weather = self.get_match_weather(home_team, match_dt)
+        requests_to_make = list(zip(matches_df['home_team'], kickoffs.dt.to_pydatetime()))
 
+        # Each lookup is an independent, latency-bound API call, so issue them
+        # concurrently; results come back in match order
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            weathers = asyncio.run(self._fetch_match_weather(requests_to_make))
+        else:
+            # Already inside an event loop (Jupyter, async callers), where
+            # asyncio.run can't nest: run the batch on its own loop in a worker thread
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                weathers = executor.submit(
+                    asyncio.run, self._fetch_match_weather(requests_to_make)
+                ).result()
+
+        # One preallocated array per column, so numeric columns stay float
+        # (NaN where weather is unavailable) rather than falling back to object
+        n = len(weathers)
+        columns = {
+            col: np.full(n, None, dtype=object) if col in WEATHER_TEXT_COLUMNS else np.full(n, np.nan)
+            for col in WEATHER_COLUMNS
+        }
+        for i, weather in enumerate(weathers):
             if weather:
-                weather_data.append({
-                    'weather_temp_c': weather.temperature_c,
-                    'weather_feels_like_c': weather.feels_like_c,
-                    'weather_humidity': weather.humidity,
-                    'weather_wind_kmh': weather.wind_speed_kmh,
-                    'weather_wind_dir': weather.wind_direction,
-                    'weather_conditions': weather.conditions,
-                    'weather_precipitation_mm': weather.precipitation_mm,
-                })
-            else:
-                weather_data.append({
-                    'weather_temp_c': None,
-                    'weather_feels_like_c': None,
-                    'weather_humidity': None,
-                    'weather_wind_kmh': None,
-                    'weather_wind_dir': None,
-                    'weather_conditions': None,
-                    'weather_precipitation_mm': None,
-                })
-
-        weather_df = pd.DataFrame(weather_data)
+                for col, attr in WEATHER_COLUMNS.items():
+                    columns[col][i] = getattr(weather, attr)
+
+        weather_df = pd.DataFrame(columns)
         return pd.concat([matches_df.reset_index(drop=True), weather_df], axis=1)
 
+    async def _fetch_match_weather(
+        self, requests_to_make: List[Tuple[str, datetime]]
+    ) -> List[Optional[WeatherData]]:
+        """Run get_match_weather for (home_team, match_datetime) pairs concurrently."""
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+        # One instant for the whole batch: a match near the 3-hour cut-off is
+        # classified the same way by the prefetch and by its own lookup
+        now = datetime.now(timezone.utc)
+
+        async def run(func, *args):
+            async with semaphore:
+                return await asyncio.to_thread(func, *args)
+
+        # Every match at a stadium shares one 5-day forecast, so fetch it once
+        # per stadium up front; the per-match lookups below then read it from
+        # the cache instead of racing each other to request it. HTTP/2 first
+        # when available, then the session for anything it didn't get
+        if self.weather_service.api_key:
+            stadiums = {self.get_stadium_coords(team) for team, match_dt in requests_to_make
+                        if self._uses_forecast(match_dt, now)}
+            stadiums.discard(None)
+            await self.weather_service.prefetch_forecasts(list(stadiums))
+            await asyncio.gather(*(run(self._prefetch_forecast, lat, lon) for lat, lon in stadiums))
+
+        return await asyncio.gather(
+            *(run(self.get_match_weather, team, dt, now) for team, dt in requests_to_make)
+        )
+
     def get_historical_weather(self, home_team: str, date: str) -> Optional[Dict]:
         """
         Get historical weather for a past match.
@@ -355,47 +505,66 @@ def calculate_travel_distance(home_team: str, away_team: str) -> Optional[float]
         away_team: Away team name
 
     Returns:
-        Distance in kilometers
+        Distance in kilometers, None if either team is unknown
     """
-    from math import radians, sin, cos, sqrt, atan2
+    return _DISTANCE_CACHE.get((home_team, away_team))
 
-    home = CPL_STADIUMS.get(home_team)
-    away = CPL_STADIUMS.get(away_team)
 
-    if not home or not away:
-        return None
+def _distance_matrix() -> np.ndarray:
+    """
+    Haversine distances between every pair of CPL stadiums.
 
-    # Haversine formula
-    R = 6371  # Earth's radius in km
+    Returns:
+        len(_TEAMS) x len(_TEAMS) array of kilometers, [home, away]
+    """
+    lats = np.radians(_LATS)
+    lons = np.radians(_LONS)
+    n = len(_TEAMS)
+
+    # Distance is symmetric and zero from a stadium to itself, so evaluate
+    # only the pairs above the diagonal and mirror them
+    i, j = np.triu_indices(n, k=1)
+    dlat = lats[j] - lats[i]
+    dlon = lons[j] - lons[i]
+
+    a = np.sin(dlat/2)**2 + np.cos(lats[i]) * np.cos(lats[j]) * np.sin(dlon/2)**2
 
-    lat1, lon1 = radians(home['lat']), radians(home['lon'])
-    lat2, lon2 = radians(away['lat']), radians(away['lon'])
+    matrix = np.zeros((n, n))
+    matrix[i, j] = matrix[j, i] = 6371 * 2 * np.arctan2(np.sqrt(a), np.sqrt(1-a))
+    return matrix
 
-    dlat = lat2 - lat1
-    dlon = lon2 - lon1
 
-    a = sin(dlat/2)**2 + cos(lat1) * cos(lat2) * sin(dlon/2)**2
-    c = 2 * atan2(sqrt(a), sqrt(1-a))
+# The stadiums are fixed, so every (home, away) distance is computed once at import
+_DISTANCES = _distance_matrix()
+_DISTANCE_CACHE: Dict[Tuple[str, str], float] = {
+    (home, away): dist
+    for home, row in zip(_TEAMS, _DISTANCES.tolist())
+    for away, dist in zip(_TEAMS, row)
+}
+
 
-    return R * c
+def travel_distance_rows() -> List[Tuple[str, str, float]]:
+    """(home_team, away_team, distance_km) for every pair of CPL teams, home-major."""
+    return [
+        (home, away, round(dist, 1))
+        for (home, away), dist in _DISTANCE_CACHE.items()
+        if home != away
+    ]
 
 
-def get_all_travel_distances() -> pd.DataFrame:
+def get_all_travel_distances() -> 'pd.DataFrame':
     """Generate travel distance matrix for all CPL teams."""
-    teams = list(CPL_STADIUMS.keys())
-    distances = []
+    import pandas as pd
 
-    for home in teams:
-        for away in teams:
-            if home != away:
-                dist = calculate_travel_distance(home, away)
-                distances.append({
-                    'home_team': home,
-                    'away_team': away,
-                    'distance_km': round(dist, 1) if dist else None
-                })
+    # Every ordered (home, away) pair except a team against itself, home-major
+    home_idx, away_idx = np.nonzero(~np.eye(len(_TEAMS), dtype=bool))
+    names = np.array(_TEAMS, dtype=object)
 
-    return pd.DataFrame(distances)
+    return pd.DataFrame({
+        'home_team': names[home_idx],
+        'away_team': names[away_idx],
+        'distance_km': _DISTANCES[home_idx, away_idx].round(1),
+    })
 
 
 if __name__ == "__main__":
@@ -403,11 +572,16 @@ if __name__ == "__main__":
     print("CPL Stadium Travel Distances")
     print("=" * 50)
 
-    distances = get_all_travel_distances()
-    print(distances.to_string(index=False))
+    distances = travel_distance_rows()
+    print(f"{'home_team':<20} {'away_team':<20} {'distance_km':>11}")
+    for home, away, dist in distances:
+        print(f"{home:<20} {away:<20} {dist:>11}")
 
     # Save to CSV
-    distances.to_csv("../data/travel_distances.csv", index=False)
+    with open("../data/travel_distances.csv", "w", newline="") as f:
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow(['home_team', 'away_team', 'distance_km'])
+        writer.writerows(distances)
     print("\nSaved to data/travel_distances.csv")
 
     # Weather example (requires API key)